@@ -4,14 +4,22 @@ class BacktestGroup:
         list_of_configurations: List[Configuration],
         source_model_path: Path,
         logging_directory: Optional[Path],
+        evaluation_store: Optional[EvaluationStore] = None,
     ) -> None:
         self.list_of_configurations = list_of_configurations
         self.source_model_path = source_model_path
+        self.evaluation_store = evaluation_store
+        self.model_hash = hash_model_artifact(source_model_path) if evaluation_store is not None else None
         self.group_id = f"{hashlib.md5(''.join(config.to_hash() for config in list_of_configurations).encode()).hexdigest()}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
         self.logging_directory = logging_directory.resolve() / self.group_id
         self.logging_directory.mkdir(parents=True)
         self.backtests = {}
         self.processes = {}
+        # statistics of backtests already evaluated against the same model, these get no process
+        self.cached_statistics = {}
+        self._started_at = None
+        # monotonic start time of every started process not joined yet, durations are measured from it
+        self._process_started_at = {}
         for config in self.list_of_configurations:
             backtest = Backtest(
                 config=config,
@@ -20,29 +28,86 @@ class BacktestGroup:
             )
             backtest_id = backtest.backtest_id
             self.backtests[backtest_id] = backtest
-            process = multiprocessing.Process(target=backtest.run)
+            if self.evaluation_store is not None:
+                statistics = self.evaluation_store.get(config, self.model_hash)
+                if statistics is not None:
+                    self.cached_statistics[backtest_id] = statistics
+                    continue
+            process = multiprocessing.Process(target=tracing.ProfiledTarget(backtest.run, backtest_id))
             self.processes[backtest_id] = process
 
+    @tracing.traced("backtest_group.start")
     def start(self) -> None:
-        for process in self.processes.values():
-            process.start()
+        self._started_at = time.monotonic()
+        for backtest_id in self.processes:
+            self._start_process(backtest_id)
 
+    @tracing.traced("backtest_group.wait")
     def wait(self) -> None:
-        for process in self.processes.values():
-            process.join()
+        # processes are joined as they finish, so every duration ends when its own process exits
+        running = {
+            process.sentinel: backtest_id
+            for backtest_id, process in self.processes.items()
+            if backtest_id in self._process_started_at
+        }
+        while running:
+            for sentinel in multiprocessing.connection.wait(list(running)):
+                self._join(running.pop(sentinel))
+
+    def _start_process(self, backtest_id: str) -> None:
+        self._process_started_at[backtest_id] = time.monotonic()
+        self.processes[backtest_id].start()
+
+    def _join(self, backtest_id: str) -> None:
+        self.processes[backtest_id].join()
+        # processes joined before are not stored twice
+        started_at = self._process_started_at.pop(backtest_id, None)
+        if started_at is not None:
+            self._store_evaluation(backtest_id, time.monotonic() - started_at)
 
     def run(self) -> None:
         self.start()
         self.wait()
 
+    def run_longest_first(self, predictor, max_parallel: int) -> MakespanReport:
+        """
+        Runs at most `max_parallel` backtests at a time, longest predicted runtime first,
+        and reports the predicted against the actual makespan.
+        """
+        predicted = {
+            backtest_id: predictor.predict(self.backtests[backtest_id].config) for backtest_id in self.processes
+        }
+        queue = sorted(self.processes, key=predicted.__getitem__, reverse=True)
+        self._started_at = time.monotonic()
+        running = {}
+        while queue or running:
+            while queue and len(running) < max_parallel:
+                backtest_id = queue.pop(0)
+                self._start_process(backtest_id)
+                running[self.processes[backtest_id].sentinel] = backtest_id
+            for sentinel in multiprocessing.connection.wait(list(running)):
+                self._join(running.pop(sentinel))
+
+        report = MakespanReport(
+            predicted=lpt_makespan(predicted.values(), max_parallel),
+            actual=time.monotonic() - self._started_at,
+        )
+        print(f"BacktestGroup {self.group_id}: {report}")
+        return report
+
     def wait_on_id(self, backtest_id: str) -> None:
-        self.processes[backtest_id].join()
+        self._join(backtest_id)
+
+    def _store_evaluation(self, backtest_id: str, duration_seconds: float) -> None:
+        if self.evaluation_store is None or self.processes[backtest_id].exitcode != 0:
+            return
+        backtest = self.backtests[backtest_id]
+        self.evaluation_store.put(backtest.config, self.model_hash, backtest.statistics, duration_seconds)
 
     def __repr__(self) -> str:
         ret = ["BacktestGroup("]
         for backtest_id, backtest in self.backtests.items():
-            process = self.processes[backtest_id]
-            process_status = "Alive" if process.is_alive() else "Terminated"
+            process = self.processes.get(backtest_id)
             ret.append(
                 f"{backtest.__repr__()} - Process Status: {get_process_status(process)},"
             )
@@ -72,7 +137,9 @@ class BacktestGroup:
     @property
     def statistics(self) -> dict:
         statistics_dict = {
-            backtest_id: backtest.statistics
+            backtest_id: self.cached_statistics[backtest_id]
+            if backtest_id in self.cached_statistics
+            else backtest.statistics
             for backtest_id, backtest in self.backtests.items()
         }
         return statistics_dict
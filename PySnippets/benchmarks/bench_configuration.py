@@ -0,0 +1,59 @@
+"""
+BaseConfiguration construction, `_process_key` overrides and `merge_configs` on synthetic configs.
+Schema validation runs against an empty schema, so only the validation call overhead is measured.
+"""
+import tempfile
+from pathlib import Path
+
+import synthetic
+from configuration import BaseConfiguration, merge_configs
+from harness import benchmark
+
+BaseConfiguration._schema = {}
+
+_include_directory = Path(tempfile.mkdtemp(prefix="bench_configuration_"))
+_include_root = synthetic.include_heavy_config(_include_directory)
+
+
+@benchmark("configuration.build.wide", setup=synthetic.wide_config, number=20)
+def build_wide(config):
+    BaseConfiguration(config)
+
+
+@benchmark("configuration.build.deep", setup=synthetic.deep_config, number=50)
+def build_deep(config):
+    BaseConfiguration(config)
+
+
+@benchmark("configuration.build.list_heavy", setup=synthetic.list_heavy_config, number=20)
+def build_list_heavy(config):
+    BaseConfiguration(config)
+
+
+@benchmark("configuration.build.include_heavy", number=10)
+def build_include_heavy(_):
+    BaseConfiguration(_include_root)
+
+
+@benchmark("configuration.process_key", setup=synthetic.list_heavy_config, number=10)
+def process_key(config):
+    BaseConfiguration(config, **synthetic.override_kwargs())
+
+
+@benchmark("configuration.merge_configs.wide", setup=lambda: (synthetic.wide_config(seed=0), synthetic.wide_config(seed=1)))
+def merge_wide(configs):
+    merge_configs(*configs)
+
+
+@benchmark("configuration.merge_configs.deep", setup=lambda: (synthetic.deep_config(seed=0), synthetic.deep_config(seed=1)))
+def merge_deep(configs):
+    merge_configs(*configs)
+
+
+@benchmark(
+    "configuration.merge_configs.list_heavy",
+    setup=lambda: (synthetic.list_heavy_config(seed=0), synthetic.list_heavy_config(seed=1)),
+    number=20,
+)
+def merge_list_heavy(configs):
+    merge_configs(*configs)
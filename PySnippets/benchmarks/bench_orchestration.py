@@ -0,0 +1,144 @@
+"""
+BacktestGroup process spawning, and Nomad/MinIO client round-trips against local stub servers.
+
+backtest.py is a fragment without imports, so BacktestGroup is loaded from its source with the
+names it uses bound to the modules defining them. Backtest is not part of this tree, BenchmarkBacktest
+takes its place with the same constructor and an empty `run`, so only the group's own overhead is timed.
+Stub servers and scratch directories are only created by the setup of the benchmarks using them,
+never at import: spawned backtest processes import this module too.
+"""
+import atexit
+import datetime
+import hashlib
+import itertools
+import multiprocessing
+import multiprocessing.connection
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+import tracing
+from harness import BENCHMARK_DIRECTORY, benchmark
+from stub_servers import minio_stub, nomad_stub
+
+GROUP_SIZE = 8
+
+_servers = {}
+_backtest_group_class = None
+_group_counter = itertools.count()
+_directories = {}
+
+
+class BenchmarkBacktest:
+    def __init__(self, config, source_model_path: Path, logging_directory: Path):
+        self.config = config
+        self.source_model_path = source_model_path
+        self.logging_directory = logging_directory
+        self.backtest_id = str(uuid.uuid4())
+        self.statistics = {}
+
+    def run(self) -> None:
+        pass
+
+
+def scratch_directory() -> Path:
+    if "scratch" not in _directories:
+        _directories["scratch"] = Path(tempfile.mkdtemp(prefix="bench_orchestration_"))
+    return _directories["scratch"]
+
+
+def load_backtest_group():
+    global _backtest_group_class
+    if _backtest_group_class is None:
+        from configuration import BaseConfiguration
+        from evaluation_store import EvaluationStore, hash_model_artifact
+        from scheduler import MakespanReport, lpt_makespan
+
+        namespace = {
+            "datetime": datetime,
+            "hashlib": hashlib,
+            "multiprocessing": multiprocessing,
+            "time": time,
+            "tracing": tracing,
+            "List": List,
+            "Optional": Optional,
+            "Path": Path,
+            "Configuration": BaseConfiguration,
+            "EvaluationStore": EvaluationStore,
+            "hash_model_artifact": hash_model_artifact,
+            "MakespanReport": MakespanReport,
+            "lpt_makespan": lpt_makespan,
+            "Backtest": BenchmarkBacktest,
+        }
+        source_path = BENCHMARK_DIRECTORY.parent / "backtest.py"
+        exec(compile(source_path.read_text(), str(source_path), "exec"), namespace)
+        _backtest_group_class = namespace["BacktestGroup"]
+    return _backtest_group_class
+
+
+def make_group(start_method: str):
+    from configuration import BaseConfiguration
+
+    BaseConfiguration._schema = {}
+    multiprocessing.set_start_method(start_method, force=True)
+    # the group id hashes the configurations, a fresh counter keeps logging directories apart
+    group = next(_group_counter)
+    configs = [BaseConfiguration({"group": group, "backtest": i}) for i in range(GROUP_SIZE)]
+    return load_backtest_group()(configs, Path("model"), scratch_directory())
+
+
+@benchmark("orchestration.backtest_group.fork", setup=lambda: make_group("fork"), number=1, repeat=10)
+def backtest_group_fork(group):
+    group.run()
+
+
+@benchmark("orchestration.backtest_group.spawn", setup=lambda: make_group("spawn"), number=1, repeat=5)
+def backtest_group_spawn(group):
+    group.run()
+
+
+def _server(name: str, factory):
+    if name not in _servers:
+        _servers[name] = factory().__enter__()
+        atexit.register(_servers[name].__exit__)
+    return _servers[name]
+
+
+def make_node_api():
+    from orion_py.nomad.api import NodeApi
+    from orion_py.nomad.config import NomadConfig
+
+    config = NomadConfig(nomad_server=_server("nomad", nomad_stub).url, nomad_token=None, nomad_namespace=None)
+    return NodeApi(config)
+
+
+def make_minio_client():
+    from orion_py.minio import MinioClient, MinioConfig
+
+    endpoint = _server("minio", minio_stub).url.removeprefix("http://")
+    config = MinioConfig(endpoint=endpoint, access_key="bench", secret_key="bench", bucket="bench", secure=False)
+    return MinioClient(config)
+
+
+@benchmark("orchestration.nomad.get_nodes", setup=make_node_api, number=100)
+def nomad_get_nodes(node_api):
+    node_api.get_nodes()
+
+
+@benchmark("orchestration.minio.exists", setup=make_minio_client, number=100)
+def minio_exists(minio_client):
+    minio_client.exists("cache/bench/art.tar.gz")
+
+
+def make_artifact():
+    path = scratch_directory() / "art.tar.gz"
+    path.write_bytes(b"\0" * (1 << 20))
+    return make_minio_client(), path
+
+
+@benchmark("orchestration.minio.upload", setup=make_artifact, number=20)
+def minio_upload(client_and_path):
+    minio_client, path = client_and_path
+    minio_client.upload(minio_path="cache/bench/art.tar.gz", local_path=path)
@@ -0,0 +1,39 @@
+"""
+Overhead of `dev.strong_referenced` per wrapped call.
+
+Usage: python benchmarks/bench_strong_referenced.py [iterations]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dev import strong_referenced  # noqa: E402
+
+
+async def plain():
+    return None
+
+
+wrapped = strong_referenced(plain)
+
+
+async def measure(coro_function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await coro_function()
+    return (time.perf_counter() - start) / iterations
+
+
+async def main(iterations: int):
+    plain_seconds = await measure(plain, iterations)
+    wrapped_seconds = await measure(wrapped, iterations)
+    print(f"plain:              {plain_seconds * 1e9:8.1f} ns/call")
+    print(f"strong_referenced:  {wrapped_seconds * 1e9:8.1f} ns/call")
+    print(f"overhead:           {(wrapped_seconds - plain_seconds) * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
@@ -0,0 +1,138 @@
+"""
+Minimal benchmark harness: registry, repeatable timing, baselines and comparison.
+
+Usage:
+    python benchmarks/harness.py run [--filter NAME] [--save [results.json]]
+    python benchmarks/harness.py compare results.json [--baseline baseline.json] [--threshold 1.10]
+
+`run --save` without a path stores the baseline of this machine in benchmarks/baseline.json,
+`compare` exits with 1 when any benchmark is slower than `threshold` times its baseline.
+"""
+import argparse
+import gc
+import importlib
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+BENCHMARK_DIRECTORY = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARK_DIRECTORY.parent))
+sys.path.insert(0, str(BENCHMARK_DIRECTORY))
+# benchmark modules import `harness`, make that resolve to this module when run as a script
+sys.modules.setdefault("harness", sys.modules[__name__])
+
+DEFAULT_BASELINE = BENCHMARK_DIRECTORY / "baseline.json"
+BENCHMARK_MODULES = ["bench_configuration", "bench_orchestration"]
+
+_benchmarks: Dict[str, dict] = {}
+
+
+def benchmark(name: str, setup: Optional[Callable] = None, number: int = 100, repeat: int = 7):
+    """
+    Registers a benchmark. `setup` returns the argument passed to the benchmarked function,
+    it runs once per repeat and is not timed.
+    """
+
+    def decorate(func):
+        _benchmarks[name] = {"func": func, "setup": setup, "number": number, "repeat": repeat}
+        return func
+
+    return decorate
+
+
+def measure(func: Callable, setup: Optional[Callable], number: int, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                func(argument)
+            timings.append((time.perf_counter() - start) / number)
+        finally:
+            gc.enable()
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(name_filter: Optional[str] = None) -> dict:
+    for module in BENCHMARK_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            print(f"skipping {module}: {e}", file=sys.stderr)
+
+    results = {}
+    for name, spec in _benchmarks.items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            results[name] = measure(spec["func"], spec["setup"], spec["number"], spec["repeat"])
+        except ImportError as e:
+            # clients and modules a benchmark needs may be missing outside the full environment
+            print(f"skipping {name}: {e}", file=sys.stderr)
+            continue
+        print(f"{name:50s} {results[name]['min'] * 1e6:12.1f} us (median {results[name]['median'] * 1e6:.1f} us)")
+    return {"python": platform.python_version(), "machine": platform.node(), "benchmarks": results}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> int:
+    """
+    Prints the ratio of current to baseline minimum timings.
+
+    Returns:
+    int: Number of benchmarks slower than `threshold` times the baseline.
+    """
+    slowdowns = 0
+    for name, result in sorted(current["benchmarks"].items()):
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            print(f"{name:50s} {'new':>10s}")
+            continue
+        ratio = result["min"] / reference["min"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  SLOWER"
+            slowdowns += 1
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{name:50s} {ratio:9.2f}x{flag}")
+    return slowdowns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run")
+    run_parser.add_argument("--filter", default=None)
+    run_parser.add_argument("--save", type=Path, nargs="?", const=DEFAULT_BASELINE, default=None)
+    compare_parser = subparsers.add_parser("compare")
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare_parser.add_argument("--threshold", type=float, default=1.10)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run(args.filter)
+        if args.save is not None:
+            args.save.write_text(json.dumps(results, indent=2))
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    return 1 if compare(baseline, current, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
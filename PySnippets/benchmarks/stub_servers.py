@@ -0,0 +1,97 @@
+"""
+In-process HTTP stand-ins for Nomad and MinIO, serving canned answers on localhost.
+They measure client-side overhead without network or cluster variance.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _NomadHandler(BaseHTTPRequestHandler):
+    nodes = [{"ID": f"node-{i}", "Name": f"server-{i}", "Status": "ready", "Cores": "64"} for i in range(16)]
+
+    def _reply(self, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/v1/nodes"):
+            self._reply(self.nodes)
+        elif self.path.startswith("/v1/node/"):
+            node_id = self.path.split("/")[3].split("?")[0]
+            node = next((node for node in self.nodes if node["ID"] == node_id), {})
+            self._reply({**node, "NodeResources": {"Cpu": {"CpuShares": 64000, "TotalCpuCores": int(node.get("Cores", 0))}}})
+        elif self.path.startswith("/v1/job/"):
+            self._reply({"ID": self.path.split("/")[3], "Status": "running"})
+        else:
+            self._reply([])
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({"EvalID": "eval", "JobModifyIndex": 1})
+
+    def log_message(self, *args):
+        pass
+
+
+class _MinioHandler(BaseHTTPRequestHandler):
+    objects = {}
+    location = b'<?xml version="1.0" encoding="UTF-8"?><LocationConstraint xmlns="http://s3.amazonaws.com/doc/2006-03-01/">us-east-1</LocationConstraint>'
+
+    def do_HEAD(self):
+        path = self.path.split("?")[0]
+        # buckets always exist, objects once they were put
+        exists = path.count("/") == 1 or path in self.objects
+        self.send_response(200 if exists else 404)
+        self.send_header("Content-Length", str(len(self.objects.get(path, b""))))
+        self.end_headers()
+
+    def do_GET(self):
+        body = self.location if "location" in self.path else self.objects.get(self.path.split("?")[0], b"")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        self.objects[self.path.split("?")[0]] = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """Serves a handler on a free localhost port in a daemon thread, usable as a context manager."""
+
+    def __init__(self, handler):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
+
+
+def nomad_stub() -> StubServer:
+    return StubServer(_NomadHandler)
+
+
+def minio_stub() -> StubServer:
+    return StubServer(_MinioHandler)
@@ -0,0 +1,52 @@
+"""
+Synthetic configuration generators covering the shapes that stress BaseConfiguration and merge_configs.
+"""
+import json
+import random
+from pathlib import Path
+
+
+def wide_config(keys: int = 2000, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {f"key_{i}": rng.choice([rng.random(), rng.randint(0, 1000), f"value_{i}", True]) for i in range(keys)}
+
+
+def deep_config(depth: int = 200, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    config = {"leaf": rng.random()}
+    for level in range(depth):
+        config = {f"level_{level}": config, f"value_{level}": rng.randint(0, 1000)}
+    return config
+
+
+def list_heavy_config(models: int = 50, entries: int = 40, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {
+        "model_configs": [
+            {
+                "name": f"model_{i}",
+                "features": [{"window": rng.randint(1, 500), "weight": rng.random()} for _ in range(entries)],
+            }
+            for i in range(models)
+        ]
+    }
+
+
+def include_heavy_config(directory: Path, includes: int = 100, seed: int = 0) -> Path:
+    """
+    Writes a root config referencing `includes` nested files through `__PATH__:` links and returns its path.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    root = {}
+    for i in range(includes):
+        include_path = directory / f"include_{i}.json"
+        include_path.write_text(json.dumps(wide_config(keys=20, seed=seed + i)))
+        root[f"section_{i}"] = f"__PATH__:{include_path.name}"
+    root_path = directory / "root.json"
+    root_path.write_text(json.dumps(root))
+    return root_path
+
+
+def override_kwargs(count: int = 200) -> dict:
+    """Named arguments in `_process_key` syntax mixing nested dicts and list indices."""
+    return {f"model_configs__list_{i % 50}__features__list_{i % 7}__window": i for i in range(count)}
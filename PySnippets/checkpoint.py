@@ -0,0 +1,196 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from evaluation_store import config_hash
+
+
+@dataclass
+class OptimizationState:
+    """
+    Optimizer state rebuilt from a journal.
+
+    Attributes:
+    submitted (Dict[str, dict]): Submitted backtests keyed by run_uuid: config_hash, job_id and extra data.
+    results (Dict[str, Any]): Results of finished backtests keyed by run_uuid.
+    generator_state (Optional[Any]): Last recorded state of the candidate generator.
+    """
+
+    submitted: Dict[str, dict] = field(default_factory=dict)
+    results: Dict[str, Any] = field(default_factory=dict)
+    generator_state: Optional[Any] = None
+
+    @property
+    def unfinished_run_uuids(self) -> List[str]:
+        return [run_uuid for run_uuid in self.submitted if run_uuid not in self.results]
+
+    @property
+    def evaluated_hashes(self) -> Set[str]:
+        return {self.submitted[run_uuid]["config_hash"] for run_uuid in self.results if run_uuid in self.submitted}
+
+
+class OptimizationJournal:
+    """
+    Append-only journal of an optimization run, one JSON record per line.
+
+    Records are flushed on every write and fsynced at most every `sync_interval` seconds,
+    so a crash loses at most that much history. Torn lines left by a crash are skipped on replay.
+    """
+
+    def __init__(self, path: Path, sync_interval: float = 5.0):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync_interval = sync_interval
+        self._file = open(path, "a", encoding="utf-8")
+        # terminate a torn record of a crashed run so the next record starts on its own line
+        if self._file.tell() > 0:
+            with open(path, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    self._file.write("\n")
+        self._synced_at = time.monotonic()
+
+    def _append(self, kind: str, **record) -> None:
+        self._file.write(json.dumps({"kind": kind, **record}) + "\n")
+        self._file.flush()
+        if time.monotonic() - self._synced_at >= self.sync_interval:
+            os.fsync(self._file.fileno())
+            self._synced_at = time.monotonic()
+
+    def record_submitted(self, run_uuid: str, config_hash: str, job_id: Optional[str] = None, extra: Any = None) -> None:
+        self._append("submitted", run_uuid=run_uuid, config_hash=config_hash, job_id=job_id, extra=extra)
+
+    def record_result(self, run_uuid: str, result: Any) -> None:
+        self._append("result", run_uuid=run_uuid, result=result)
+
+    def record_generator_state(self, state: Any) -> None:
+        self._append("generator_state", state=state)
+
+    def close(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    @staticmethod
+    def replay(path: Path) -> OptimizationState:
+        state = OptimizationState()
+        if not path.exists():
+            return state
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # torn write of a record before a crash
+                    continue
+                kind = record.pop("kind")
+                if kind == "submitted":
+                    state.submitted[record.pop("run_uuid")] = record
+                elif kind == "result":
+                    state.results[record["run_uuid"]] = record["result"]
+                elif kind == "generator_state":
+                    state.generator_state = record["state"]
+        return state
+
+
+def reattach_jobs(state: OptimizationState, job_manager) -> Tuple[Dict[str, Any], Dict[str, Any], List[str]]:
+    """
+    Matches backtests submitted before a restart against the cluster instead of resubmitting them.
+
+    Returns:
+    Tuple[Dict[str, Any], Dict[str, Any], List[str]]: Job objects of runs still running keyed by run_uuid,
+    results of runs that succeeded meanwhile keyed by run_uuid, and run_uuids that were lost, failed or
+    were stopped and need resubmitting.
+    """
+    unfinished = state.unfinished_run_uuids
+    job_ids = {job_id.split("/")[-1]: job_id for job_id in job_manager.get_job_ids()}
+
+    running = {}
+    succeeded = []
+    for run_uuid in unfinished:
+        job_id = job_ids.get(run_uuid)
+        if job_id is None:
+            continue
+        if not job_manager.is_finished_job(job_manager.get_job_status(job_id)):
+            running[run_uuid] = job_manager.get_job_object(job_id)
+        elif job_manager.is_success_job(job_id):
+            succeeded.append(run_uuid)
+    # statistics of failed or stopped jobs are partial, those runs count as lost
+    finished = job_manager.get_backtest_results(succeeded, succeeded=True) if succeeded else {}
+    lost = [run_uuid for run_uuid in unfinished if run_uuid not in running and run_uuid not in finished]
+    return running, finished, lost
+
+
+class JournaledRunner:
+    """
+    Runner journaling every submission and result of the runner it wraps, and resuming from the journal.
+
+    Opened on the journal of an interrupted run, configurations whose result was journaled are not
+    evaluated again, backtests still running on the cluster are waited for instead of resubmitted
+    (runners with a `job_manager` and a `wait(run_uuid, job)` method), and only lost ones run again.
+    Configurations are matched by their config hash.
+
+    Attributes:
+    runner (Any): Wrapped runner, `evaluate(configuration, run_uuid)` returns the result.
+    journal (OptimizationJournal): Journal records are appended to.
+    state (OptimizationState): State replayed from the journal when the runner was created.
+    """
+
+    def __init__(self, runner, journal: OptimizationJournal):
+        self.runner = runner
+        self.journal = journal
+        self.state = OptimizationJournal.replay(journal.path)
+        submitted = self.state.submitted
+        self._results = {
+            submitted[run_uuid]["config_hash"]: result
+            for run_uuid, result in self.state.results.items()
+            if run_uuid in submitted
+        }
+        # config_hash -> run_uuid of runs submitted before the restart without a journaled result
+        self._unfinished = {submitted[run_uuid]["config_hash"]: run_uuid for run_uuid in self.state.unfinished_run_uuids}
+        self._running = {}
+        self._reattached = None
+
+    async def _reattach(self) -> None:
+        job_manager = getattr(self.runner, "job_manager", None)
+        if job_manager is None or not hasattr(self.runner, "wait"):
+            # local backtests do not survive a restart
+            self._unfinished.clear()
+            return
+        if not self._unfinished:
+            return
+        running, finished, lost = await asyncio.get_running_loop().run_in_executor(
+            None, reattach_jobs, self.state, job_manager
+        )
+        for run_uuid, result in finished.items():
+            self.journal.record_result(run_uuid, result)
+            self._results[self.state.submitted[run_uuid]["config_hash"]] = result
+        for run_uuid in lost:
+            self._unfinished.pop(self.state.submitted[run_uuid]["config_hash"], None)
+        self._running = running
+
+    async def evaluate(self, configuration, run_uuid: Optional[str] = None):
+        if self._reattached is None:
+            self._reattached = asyncio.ensure_future(self._reattach())
+        await self._reattached
+
+        key = config_hash(configuration)
+        if key in self._results:
+            return self._results[key]
+
+        previous_run_uuid = self._unfinished.pop(key, None)
+        if previous_run_uuid in self._running:
+            run_uuid = previous_run_uuid
+            result = await self.runner.wait(run_uuid, self._running.pop(run_uuid))
+        else:
+            run_uuid = run_uuid or str(uuid.uuid4())
+            self.journal.record_submitted(run_uuid, key)
+            result = await self.runner.evaluate(configuration, run_uuid)
+        self.journal.record_result(run_uuid, result)
+        self._results[key] = result
+        return result
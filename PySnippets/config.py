@@ -1,11 +1,61 @@
-from time import sleep
+import asyncio
+import contextlib
+import dis
+import operator
+import random
+from collections import deque
+
+
+def _functions(value):
+    """Plain functions behind a class body value: methods, static/class methods and property accessors."""
+    if isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+    if isinstance(value, property):
+        return [accessor for accessor in (value.fget, value.fset, value.fdel) if accessor is not None]
+    return [value] if hasattr(value, '__code__') else []
+
+
+def _assigned_attributes(class_dict):
+    """
+    Names of attributes assigned as `self.<name> = ...` in the methods of a class body,
+    nested functions and property accessors included. Attributes assigned any other way
+    (`setattr`, `__dict__`, decorated functions) are missed, they are found by `Config.__getattr__`.
+    """
+    names = []
+    codes = [function.__code__ for value in class_dict.values() for function in _functions(value)]
+    while codes:
+        code = codes.pop()
+        for instruction in dis.get_instructions(code):
+            if instruction.opname == 'STORE_ATTR' and instruction.argval not in names:
+                names.append(instruction.argval)
+        codes.extend(const for const in code.co_consts if hasattr(const, 'co_code'))
+    return names
+
+
+def _path_accessor(name, path):
+    getter = operator.attrgetter('.'.join(path + (name,)))
+    owner = operator.attrgetter('.'.join(path))
+
+    def setter(self, value):
+        setattr(owner(self), name, value)
+
+    return property(getter, setter)
+
 
 class ConfigMeta(type):
+    """
+    Resolves attributes of nested sub-configs once, at class creation: every name reachable
+    through sub-configs (class attributes and attributes assigned in their methods) becomes
+    a property reading it by its precomputed path, so lookups do not scan sub-configs at runtime.
+    """
     def __new__(cls, name, bases, class_dict):
         combined_dict = {**class_dict, **class_dict.get('__annotations__', {})}
         config_fields = {
             k: v for k, v in combined_dict.items() if isinstance(v, type) and issubclass(v, Config)
         }
+        instance_attributes = set(config_fields).union(_assigned_attributes(class_dict))
+        for base in bases:
+            instance_attributes.update(getattr(base, '_instance_attributes', ()))
         orig_init = class_dict.get('__init__')
 
         def __init__(self, dictionary):
@@ -15,11 +65,35 @@ class ConfigMeta(type):
                 orig_init(self, dictionary)
 
         class_dict['__init__'] = __init__
-        return super().__new__(cls, name, bases, class_dict)
+        new_class = super().__new__(cls, name, bases, class_dict)
+        new_class._instance_attributes = frozenset(instance_attributes)
+
+        # name -> path of sub-config fields leading to the config that owns the name
+        paths = {}
+        for base in reversed(new_class.__mro__[1:]):
+            paths.update(getattr(base, '_paths', {}))
+        for field_name, field_type in config_fields.items():
+            for attribute in [*dir(field_type), *field_type._instance_attributes]:
+                if attribute.startswith('__') or attribute in ('_paths', '_instance_attributes'):
+                    continue
+                paths.setdefault(attribute, (field_name,) + field_type._paths.get(attribute, ()))
+
+        # names of the class itself, its own instance attributes included, are not redirected
+        own_names = set(dir(new_class)) | instance_attributes
+        for attribute, path in paths.items():
+            if attribute not in own_names:
+                setattr(new_class, attribute, _path_accessor(attribute, path))
+        new_class._paths = paths
+        return new_class
+
 
 class Config(metaclass=ConfigMeta):
+    _paths = {}
+    _instance_attributes = frozenset()
+
     def __getattr__(self, name):
-        for field_name, field_value in self.__dict__.items():
+        # names missing from the precomputed paths, e.g. set with setattr on a sub-config
+        for field_value in self.__dict__.values():
             if isinstance(field_value, Config) and hasattr(field_value, name):
                 return getattr(field_value, name)
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
@@ -36,19 +110,104 @@ class LogConfig(Config):
     def set_target(self, path):
         self._target = path
 
+class ConnectionPool:
+    def __init__(self, host, port, min_size=1, max_size=10, retries=10, backoff_base=0.1, backoff_max=5.0,
+                 health_check=None):
+        if retries < 1:
+            raise ValueError(f"retries must be at least 1, got {retries}")
+        self._host = host
+        self._port = port
+        self._min_size = min_size
+        self._retries = retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._health_check = health_check
+        self._idle = deque()
+        self._slots = asyncio.Semaphore(max_size)
+
+    async def start(self):
+        for connection in await asyncio.gather(*(self._open() for _ in range(self._min_size))):
+            self._idle.append(connection)
+
+    async def _open(self):
+        # full jitter exponential backoff, so processes started together do not reconnect in lockstep
+        for attempt in range(self._retries):
+            try:
+                return await asyncio.open_connection(self._host, self._port)
+            except OSError:
+                if attempt == self._retries - 1:
+                    raise
+                await asyncio.sleep(random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** attempt)))
+
+    async def _is_healthy(self, connection):
+        reader, writer = connection
+        if writer.is_closing() or reader.at_eof():
+            return False
+        return self._health_check is None or await self._health_check(reader, writer)
+
+    async def acquire(self):
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                connection = self._idle.pop()
+                if await self._is_healthy(connection):
+                    return connection
+                connection[1].close()
+            return await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection):
+        if not connection[1].is_closing():
+            self._idle.append(connection)
+        self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def connection(self):
+        connection = await self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            connection[1].close()
+            raise
+        finally:
+            self.release(connection)
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            await writer.wait_closed()
+
+
 class DatabaseConfig(Config):
     def __init__(self, d):
         self._host = d.get("host", "localhost")
         self._port = d.get("port", 1234)
         self._username = d.get("username", "admin")
         self._password = d.get("password", "1234")
+        self._min_pool_size = d.get("min_pool_size", 1)
+        self._max_pool_size = d.get("max_pool_size", 10)
+        self._connect_retries = d.get("connect_retries", 10)
+        self._pool = None
     def set_username(self, username):
         self._username = username
     def set_password(self, password):
         self._password = password
-    def connect(self):
-        for _ in range(10):
-            sleep(1)
+    async def connect(self):
+        if self._pool is None:
+            pool = self._pool = ConnectionPool(
+                self._host, self._port, self._min_pool_size, self._max_pool_size, self._connect_retries
+            )
+            try:
+                await pool.start()
+            except BaseException:
+                # the next connect() retries instead of returning a pool without connections
+                self._pool = None
+                await pool.close()
+                raise
+        return self._pool
 
 
 class AppConfig(Config):
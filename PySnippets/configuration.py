@@ -9,6 +9,8 @@ import jsonschema
 from jsonschema.exceptions import ValidationError
 from orion_py.utils import hash_dict
 
+import tracing
+
 
 class BaseConfiguration:
     _schema_paths = [
@@ -66,6 +68,7 @@ class BaseConfiguration:
         - `Configuration(config, configs__minio_config: '__PATH__:file.json')`.
     """
 
+    @tracing.traced("configuration.build")
     def __init__(self, config=None, **kwargs):
         # If config is a Path, load and convert the JSON file
         if isinstance(config, Path):
@@ -126,6 +129,7 @@ class BaseConfiguration:
             with open(schema_path, "r") as f:
                 cls._schema = json.load(f)
 
+    @tracing.traced("configuration.validate")
     def validate_config(self, config: dict) -> bool:
         """
         Validates the current configuration against the loaded JSON schema.
@@ -0,0 +1,147 @@
+import asyncio
+import copy
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence
+
+from checkpoint import JournaledRunner, OptimizationJournal
+from evaluation_store import config_hash
+from hyperparameter_grid import HyperparameterGrid
+
+
+@dataclass
+class ValueSource:
+    path: Any
+    values: List[Any]
+
+
+def as_value_source(source) -> ValueSource:
+    """
+    Accepts a `Hyperparameter` (path, get_values) or a `Field` (field, initial_values).
+    """
+    if hasattr(source, "get_values"):
+        return ValueSource(source.path, list(source.get_values()))
+    return ValueSource(getattr(source, "path", getattr(source, "field", None)), list(source.initial_values()))
+
+
+class ParallelCoordinateDescent:
+    """
+    Coordinate descent over hyperparameter sets, with all sets of a round evaluated concurrently.
+
+    Every set expands the product of its values against the best configuration known when the set starts.
+    When a set finishes with an improvement, its winning values are merged into the best configuration
+    known at that moment. If other sets changed the best configuration in between, the merged
+    configuration is evaluated before it is accepted. All evaluations share one concurrency budget.
+    Rows equal to the base configuration are not evaluated again, and identical configurations
+    proposed by several sets or rounds are evaluated once.
+
+    With a `journal`, evaluations are journaled. A restarted descent replays from the initial configuration:
+    journaled evaluations are not repeated and backtests still running are waited for, so it catches up
+    to the interrupted point without new backtests.
+
+    Attributes:
+    configuration (Any): Best configuration so far, needs `set_by_path`.
+    best_score (Optional[float]): Score of `configuration`, higher is better.
+    """
+
+    def __init__(
+        self,
+        configuration,
+        hyperparameter_sets: Sequence,
+        runner,
+        score: Callable[[Any], float],
+        max_concurrency: int,
+        rounds: int = 1,
+        journal: Optional[OptimizationJournal] = None,
+    ):
+        self.configuration = configuration
+        self.hyperparameter_sets = hyperparameter_sets
+        self.runner = JournaledRunner(runner, journal) if journal is not None else runner
+        self.score = score
+        self.rounds = rounds
+        self.best_score: Optional[float] = None
+        self._budget = asyncio.Semaphore(max_concurrency)
+        self._version = 0
+        # config_hash -> task of the score of every configuration evaluated or being evaluated
+        self._evaluations = {}
+
+    async def _evaluate(self, configuration, acquired: bool = False) -> float:
+        """
+        Score of a configuration. Identical configurations, by config hash, are evaluated only once:
+        later and concurrent callers share the first evaluation. `acquired` tells a budget slot is held
+        for this call already.
+        """
+        key = config_hash(configuration)
+        evaluation = self._evaluations.get(key)
+        if evaluation is None:
+            evaluation = self._evaluations[key] = asyncio.ensure_future(self._run(configuration, acquired))
+        elif acquired:
+            self._budget.release()
+        # a cancelled caller must not cancel the evaluation other callers wait for
+        return await asyncio.shield(evaluation)
+
+    async def _run(self, configuration, acquired: bool) -> float:
+        if not acquired:
+            await self._budget.acquire()
+        try:
+            return self.score(await self.runner.evaluate(configuration))
+        finally:
+            self._budget.release()
+
+    async def _evaluate_row(self, grid: HyperparameterGrid, row, base_key: str, base_score: float) -> float:
+        # configurations are materialized only once a slot of the budget is free
+        await self._budget.acquire()
+        configuration = grid.materialize(row)
+        if config_hash(configuration) == base_key:
+            # the row of the base values, its score is known already
+            self._budget.release()
+            return base_score
+        return await self._evaluate(configuration, acquired=True)
+
+    async def _optimize_set(self, hyperparameter_set) -> bool:
+        sources = [as_value_source(source) for source in hyperparameter_set.fields]
+        base, base_score, base_version = self.configuration, self.best_score, self._version
+
+        grid = HyperparameterGrid(base, sources, [source.values for source in sources])
+        rows = grid.product()
+        base_key = config_hash(base)
+        scores = await asyncio.gather(*(self._evaluate_row(grid, row, base_key, base_score) for row in rows))
+        hyperparameter_set.finished = True
+
+        if not scores:
+            # a hyperparameter without values
+            return False
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best_index] <= base_score:
+            return False
+
+        merged, merged_score = grid.materialize(rows[best_index]), scores[best_index]
+        while self._version != base_version:
+            base_version = self._version
+            merged = copy.deepcopy(self.configuration)
+            for source, value in zip(sources, grid.values(rows[best_index])):
+                merged.set_by_path(source.path, value)
+            merged_score = await self._evaluate(merged)
+        if merged_score <= self.best_score:
+            return False
+
+        self.configuration, self.best_score = merged, merged_score
+        self._version += 1
+        return True
+
+    async def optimize(self):
+        """
+        Runs up to `rounds` sweeps over all hyperparameter sets, stopping after a sweep without improvement.
+
+        Returns:
+        Any: Best configuration found.
+        """
+        if self.best_score is None:
+            self.best_score = await self._evaluate(self.configuration)
+
+        for _ in range(self.rounds):
+            for hyperparameter_set in self.hyperparameter_sets:
+                hyperparameter_set.finished = False
+            improved = await asyncio.gather(*(self._optimize_set(hyperset) for hyperset in self.hyperparameter_sets))
+            if not any(improved):
+                break
+        return self.configuration
@@ -1,13 +1,23 @@
 import asyncio
+import concurrent.futures
+import contextlib
+import fcntl
 import functools
+import itertools
 import json
+import struct
 import sys
-import weakref
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import deque
 from enum import Enum
-from threading import Thread
-from typing import Type, TypeVar
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from threading import BoundedSemaphore, Lock, Thread, current_thread
+from typing import Callable, Dict, Hashable, Optional, Type, TypeVar
 
-from orion_py.types import Duration, Timestamp
+from orion_py.types import Duration
 
 
 def checkable_enum(cls):
@@ -21,31 +31,258 @@ def checkable_enum(cls):
     return cls
 
 
-def async_rate_limited(duration: Duration, count: int):
+class _AsyncLimiter(ABC):
+    """
+    Base of asyncio limiters. Waiters are granted in FIFO order by a single timer,
+    so only the waiter at the head of the queue is woken when capacity frees up.
+    A limiter may be shared by coroutines of several event loops in different threads:
+    its state is guarded by a lock and every waiter is woken on its own loop.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # (loop, future) of waiting acquisitions
+        self._waiters = deque()
+        self._wakeup = None
+
+    @abstractmethod
+    def _try_acquire(self, now: float) -> bool:
+        pass
+
+    @abstractmethod
+    def _next_delay(self, now: float) -> float:
+        pass
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._try_acquire(time.monotonic()):
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+            self._wake()
+        await future
+
+    @staticmethod
+    def _grant(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def _start_timer(self) -> None:
+        # runs on the loop of the head waiter, which stays alive while that waiter waits
+        with self._lock:
+            self._wakeup = asyncio.get_running_loop().call_later(self._next_delay(time.monotonic()), self._on_timer)
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._wakeup = None
+            self._wake()
+
+    def _wake(self) -> None:
+        # called with the lock held
+        now = time.monotonic()
+        while self._waiters:
+            loop, future = self._waiters[0]
+            if future.cancelled():
+                self._waiters.popleft()
+            elif self._try_acquire(now):
+                self._waiters.popleft()
+                loop.call_soon_threadsafe(self._grant, future)
+            else:
+                break
+        if self._waiters and self._wakeup is None:
+            # marks the timer as pending until _start_timer schedules it
+            self._wakeup = True
+            self._waiters[0][0].call_soon_threadsafe(self._start_timer)
+
+
+class SlidingWindowLimiter(_AsyncLimiter):
+    """
+    Allows at most `count` acquisitions during any window of `window` seconds.
+    Acquisition times are kept in a ring buffer of `count` entries.
+    """
+
+    def __init__(self, window: float, count: int):
+        super().__init__()
+        self.window = window
+        self._calls = deque(maxlen=count)
+
+    def _try_acquire(self, now: float) -> bool:
+        if len(self._calls) == self._calls.maxlen and now - self._calls[0] < self.window:
+            return False
+        self._calls.append(now)
+        return True
+
+    def _next_delay(self, now: float) -> float:
+        return self._calls[0] + self.window - now
+
+
+class TokenBucketLimiter(_AsyncLimiter):
+    """
+    Refills `count` tokens per `window` seconds, holding at most `burst` tokens.
+    Allows bursts of up to `burst` acquisitions after idle periods.
+    """
+
+    def __init__(self, window: float, count: int, burst: int):
+        super().__init__()
+        self.rate = count / window
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_acquire(self, now: float) -> bool:
+        self._refill(now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _next_delay(self, now: float) -> float:
+        return (1 - self._tokens) / self.rate
+
+
+def async_rate_limited(
+    duration: Duration,
+    count: int,
+    burst: Optional[int] = None,
+    key: Optional[Callable[..., Hashable]] = None,
+):
     """
     Limits execution of the coroutine based based on timeframe.
-    Maximum of `count` calls allowed during a `duration`.
+    Maximum of `count` calls allowed during a `duration`, counted when calls start.
+    With `burst` the limit is a token bucket refilled at `count` per `duration` and holding up to `burst` calls.
+    With `key` there is a separate limit for every value of `key(*args, **kwargs)`, e.g. one per endpoint.
+    Waiting calls are started in the order they were made.
     """
 
+    window = duration.GetSecondsFloat()
+
+    def make_limiter():
+        if burst is not None:
+            return TokenBucketLimiter(window, count, burst)
+        return SlidingWindowLimiter(window, count)
+
     def decorate(coro):
-        calls = []
+        limiters = {}
 
+        @functools.wraps(coro)
         async def rate_limited_coroutine(*args, **kargs):
-            now = Timestamp.Now()
+            limiter_key = key(*args, **kargs) if key is not None else None
+            limiter = limiters.get(limiter_key)
+            if limiter is None:
+                # callers on other threads may race to create it, all of them must share the one stored
+                limiter = limiters.setdefault(limiter_key, make_limiter())
+            await limiter.acquire()
+            return await coro(*args, **kargs)
 
-            while calls and now - calls[0] > duration:
-                calls.pop(0)
+        return rate_limited_coroutine
+
+    return decorate
+
+
+class SharedRateLimiter:
+    """
+    Sliding window limiter shared by all processes of the host that use the same `name`.
+
+    Allows at most `count` acquisitions during any window of `window` seconds across processes.
+    The ring of acquisition times lives in a shared memory segment and is guarded by an flock
+    on a lock file, the same way the pid table in CSnippets guards its shared memory with a semaphore.
+    Processes are not served in any particular order.
+    """
+
+    # ring head, then the count and window the segment was created with
+    _header = struct.Struct("qqd")
+
+    def __init__(self, name: str, window: float, count: int):
+        self.name = name
+        self.window = window
+        self.count = count
+        self._ring = struct.Struct(f"{count}d")
+        self._lock_file = open(Path(tempfile.gettempdir()) / f"{name}.lock", "a")
+        size = self._header.size + self._ring.size
+
+        with self._locked():
+            try:
+                self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+                self._header.pack_into(self._shm.buf, 0, 0, count, window)
+                self._ring.pack_into(self._shm.buf, self._header.size, *([float("-inf")] * count))
+            except FileExistsError:
+                self._shm = shared_memory.SharedMemory(name=name)
+        # the segment must outlive this process, other processes may still use it
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        _, existing_count, existing_window = self._header.unpack_from(self._shm.buf, 0)
+        if (existing_count, existing_window) != (count, window):
+            self.close()
+            raise ValueError(
+                f"Shared limiter {name} already exists with count {existing_count} and window {existing_window}, "
+                f"not count {count} and window {window}"
+            )
+
+    @contextlib.contextmanager
+    def _locked(self):
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def try_acquire(self) -> float:
+        """
+        Acquires if possible.
+
+        Returns:
+        float: 0 if acquired, otherwise seconds until the next acquisition may succeed.
+        """
+        buf = self._shm.buf
+        with self._locked():
+            now = time.monotonic()
+            (head,) = struct.unpack_from("q", buf, 0)
+            slot = self._header.size + head * 8
+            (oldest,) = struct.unpack_from("d", buf, slot)
+            if now - oldest < self.window:
+                return oldest + self.window - now
+            struct.pack_into("d", buf, slot, now)
+            struct.pack_into("q", buf, 0, (head + 1) % self.count)
+            return 0.0
+
+    def acquire(self) -> None:
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        while (delay := self.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        self._shm.close()
+        self._lock_file.close()
+
+    def unlink(self) -> None:
+        """Removes the shared segment, call once when no process uses the limiter anymore."""
+        self._shm.unlink()
+
+
+def shared_rate_limited(name: str, duration: Duration, count: int):
+    """
+    Limits execution of the coroutine to `count` calls during a `duration`
+    across all processes of the host using the same `name`.
+    """
 
-            while len(calls) >= count:
-                wait_duration = (calls[0] + duration) - now
-                await asyncio.sleep(wait_duration.GetSecondsFloat())
-                now = Timestamp.Now()
-                while calls and now - calls[0] > duration:
-                    calls.pop(0)
+    def decorate(coro):
+        limiter = None
 
-            ret = await coro(*args, **kargs)
-            calls.append(Timestamp.Now())
-            return ret
+        @functools.wraps(coro)
+        async def rate_limited_coroutine(*args, **kargs):
+            nonlocal limiter
+            if limiter is None:
+                limiter = SharedRateLimiter(name, duration.GetSecondsFloat(), count)
+            await limiter.acquire_async()
+            return await coro(*args, **kargs)
 
         return rate_limited_coroutine
 
@@ -82,51 +319,125 @@ class Configurable:
 
 
 class ThreadedEventLoop:
-    def __init__(self):
-        self.loop = asyncio.new_event_loop()
-        self.thread = Thread(target=self._start_loop)
-        self.thread.daemon = True
-        self.thread.start()
+    """
+    Event loops running in background threads, for submitting coroutines from sync code.
+
+    Coroutines are spread round-robin over `num_loops` loops, or pinned to a loop by `shard`.
+    With `max_in_flight`, `submit` blocks while that many coroutines are still running.
+    """
 
-    def _start_loop(self):
+    def __init__(self, num_loops: int = 1, max_in_flight: Optional[int] = None):
+        self.loops = [asyncio.new_event_loop() for _ in range(num_loops)]
+        self.threads = [Thread(target=self._start_loop, args=(loop,), daemon=True) for loop in self.loops]
+        self.loop = self.loops[0]
+        self.thread = self.threads[0]
+        self._in_flight = BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        self._round_robin = itertools.count()
+        for thread in self.threads:
+            thread.start()
+
+    def _start_loop(self, loop):
         """Run the event loop."""
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
 
-    def submit(self, coro):
-        """Submit a coroutine to the event loop."""
-        asyncio.run_coroutine_threadsafe(coro, self.loop)
+    def submit(self, coro, shard: Optional[Hashable] = None) -> concurrent.futures.Future:
+        """Submit a coroutine to one of the event loops and return a future of its result."""
+        if shard is None:
+            loop = self.loops[next(self._round_robin) % len(self.loops)]
+        else:
+            loop = self.loops[hash(shard) % len(self.loops)]
+
+        if self._in_flight is None:
+            return asyncio.run_coroutine_threadsafe(coro, loop)
+
+        self._in_flight.acquire()
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        except BaseException:
+            self._in_flight.release()
+            raise
+        future.add_done_callback(lambda _: self._in_flight.release())
+        return future
+
+    def run(self, coro, timeout: Optional[float] = None, shard: Optional[Hashable] = None):
+        """Run a coroutine on one of the event loops and block until it returns."""
+        if current_thread() in self.threads:
+            coro.close()
+            raise RuntimeError("ThreadedEventLoop.run would deadlock when called from its own loop thread")
+        return self.submit(coro, shard).result(timeout)
 
     def stop(self):
-        """Stop the event loop and wait for the thread to finish."""
-        self.loop.call_soon_threadsafe(self.loop.stop)
-        self.thread.join()
+        """Stop the event loops and wait for the threads to finish."""
+        for loop in self.loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in self.threads:
+            thread.join()
+        for loop in self.loops:
+            loop.close()
+
+
+_default_event_loop = None
+_default_event_loop_lock = Lock()
+
+
+def get_default_event_loop() -> ThreadedEventLoop:
+    """Return the process-wide ThreadedEventLoop, starting it on first use."""
+    global _default_event_loop
+    if _default_event_loop is None:
+        with _default_event_loop_lock:
+            if _default_event_loop is None:
+                _default_event_loop = ThreadedEventLoop()
+    return _default_event_loop
+
 
+def sync_facade(coro):
+    """
+    Turns a coroutine function into a blocking function.
+    Runs on the shared background event loop instead of creating a new loop with `asyncio.run` per call.
+    """
+
+    @functools.wraps(coro)
+    def wrapper(*args, **kwargs):
+        return get_default_event_loop().run(coro(*args, **kwargs))
 
+    return wrapper
+
+
+# outstanding coroutines mapped to the monotonic time they were started at
 _coroutine_references = {}
 
 
 def strong_referenced(coro):
     @functools.wraps(coro)
     async def wrapper(*args, **kwargs):
-        weak_coro = weakref.WeakValueDictionary()
-
         coroutine = coro(*args, **kwargs)
 
-        _coroutine_references[id(coroutine)] = coroutine
-
-        weak_coro[id(coroutine)] = coroutine
-
+        _coroutine_references[coroutine] = time.monotonic()
         try:
-            result = await coroutine
+            return await coroutine
         finally:
-            del _coroutine_references[id(coroutine)]
-
-        return result
+            del _coroutine_references[coroutine]
 
     return wrapper
 
 
+def get_outstanding_coroutines() -> Dict[str, Dict[str, float]]:
+    """
+    Returns statistics of coroutines started through `strong_referenced` that have not finished yet.
+
+    Returns:
+    Dict[str, Dict[str, float]]: `count` and `oldest_age` in seconds keyed by coroutine qualified name.
+    """
+    now = time.monotonic()
+    stats = {}
+    for coroutine, started in list(_coroutine_references.items()):
+        entry = stats.setdefault(coroutine.__qualname__, {"count": 0, "oldest_age": 0.0})
+        entry["count"] += 1
+        entry["oldest_age"] = max(entry["oldest_age"], now - started)
+    return stats
+
+
 if "pytest" in sys.modules:
 
     def strong_referenced_during_tests(coro):
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from orion_py.utils import hash_dict
+
+
+def config_hash(config) -> str:
+    """Hash of a configuration, `BaseConfiguration.to_hash()` or the hash of a plain config dict."""
+    if hasattr(config, "to_hash"):
+        return config.to_hash()
+    return hash_dict(config)
+
+
+def hash_model_artifact(path: Path) -> str:
+    """sha256 over relative names and contents of all files of a model artifact, a file or a directory."""
+    digest = hashlib.sha256()
+    files = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+    for file in files:
+        digest.update(str(file.relative_to(path) if file != path else file.name).encode())
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class EvaluationStore:
+    """
+    Persistent statistics of evaluated backtests keyed by configuration hash and model artifact hash.
+
+    A configuration evaluated against the same model always gives the same statistics,
+    so a hit replaces running the backtest.
+
+    Attributes:
+    database_path (Path): Location of the SQLite store.
+    """
+
+    def __init__(self, database_path: Path):
+        self.database_path = database_path
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluations (
+                config_hash TEXT NOT NULL,
+                model_hash TEXT NOT NULL,
+                statistics TEXT NOT NULL,
+                duration_seconds REAL,
+                created REAL NOT NULL,
+                configuration TEXT,
+                PRIMARY KEY (config_hash, model_hash)
+            )
+            """
+        )
+
+    def get(self, config, model_hash: str) -> Optional[Any]:
+        """
+        Returns statistics stored for the configuration and model, or None.
+        """
+        row = self._connection.execute(
+            "SELECT statistics FROM evaluations WHERE config_hash = ? AND model_hash = ?",
+            (config_hash(config), model_hash),
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, config, model_hash: str, statistics: Any, duration_seconds: Optional[float] = None) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO evaluations "
+                "(config_hash, model_hash, statistics, duration_seconds, created, configuration) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    config_hash(config),
+                    model_hash,
+                    json.dumps(statistics),
+                    duration_seconds,
+                    time.time(),
+                    json.dumps(getattr(config, "config", config)),
+                ),
+            )
+
+    def history(self, model_hash: Optional[str] = None) -> Iterable[Tuple[str, Any, Optional[float]]]:
+        """
+        Yields (config_hash, statistics, duration_seconds) of stored evaluations, optionally of one model only.
+        """
+        query = "SELECT config_hash, statistics, duration_seconds FROM evaluations"
+        parameters: Tuple = ()
+        if model_hash is not None:
+            query += " WHERE model_hash = ?"
+            parameters = (model_hash,)
+        for stored_hash, statistics, duration_seconds in self._connection.execute(query, parameters):
+            yield stored_hash, json.loads(statistics), duration_seconds
+
+    def durations(self, model_hash: Optional[str] = None) -> Iterable[Tuple[dict, float]]:
+        """
+        Yields (configuration, duration_seconds) of stored evaluations with a known duration, for runtime prediction.
+        """
+        query = "SELECT configuration, duration_seconds FROM evaluations WHERE configuration IS NOT NULL AND duration_seconds IS NOT NULL"
+        parameters: Tuple = ()
+        if model_hash is not None:
+            query += " AND model_hash = ?"
+            parameters = (model_hash,)
+        for configuration, duration_seconds in self._connection.execute(query, parameters):
+            yield json.loads(configuration), duration_seconds
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+
+def split_cached(store: Optional[EvaluationStore], configs, model_hash: str) -> Tuple[Dict[int, Any], list]:
+    """
+    Splits configurations into stored ones and ones that still have to run.
+
+    Returns:
+    Tuple[Dict[int, Any], list]: Stored statistics keyed by index in `configs`, indices of configs to run.
+    """
+    cached = {}
+    to_run = []
+    for index, config in enumerate(configs):
+        statistics = store.get(config, model_hash) if store is not None else None
+        if statistics is None:
+            to_run.append(index)
+        else:
+            cached[index] = statistics
+    return cached, to_run
@@ -1,3 +1,5 @@
+from hyperparameter_grid import HyperparameterGrid
+
 class Hyperparameter:
     def __init__(self, path: List[str], get_values: Optional[Callable]):
         self.path = path
@@ -11,10 +13,10 @@ class Configuration:
     def substitute(self, hyperparameter: List[Hyperparameter], values: Optional[List[Any]]=None):
         if not values:
             values = hyperparameter.get_values()
-        configurations = [copy.deepcopy(self) for _ in range(len(values))] 
-        for index, value in enumerate(values):
-            configurations[index].set_by_path(hyperparameter.path, value)
-        return configurations
+        return list(self.grid([hyperparameter], [values]).configurations())
+    def grid(self, hyperparameters: List[Hyperparameter], values: Optional[List[List[Any]]]=None):
+        # variants are index rows over per-hyperparameter value tables, configs are copied only when iterated
+        return HyperparameterGrid(self, hyperparameters, values)
 
 class GenerateNewValues1:
     def __init__(self, runner):
@@ -0,0 +1,78 @@
+import copy
+import math
+from typing import Any, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+class HyperparameterGrid:
+    """
+    Product of the values of several hyperparameters, represented without building configurations.
+
+    Every hyperparameter owns a value table, and a variant is a row of indices into those tables,
+    so whole grids and samples are plain integer arrays of shape (variants, hyperparameters).
+    Configurations are only materialized, one deepcopy each, when iterated over.
+
+    Attributes:
+    base (Any): Configuration the values are substituted into, needs `set_by_path`.
+    paths (List[List[str]]): Paths of the hyperparameters inside the configuration.
+    value_tables (List[List[Any]]): Candidate values of every hyperparameter.
+    """
+
+    def __init__(self, base, hyperparameters: Sequence, values: Optional[Sequence[Sequence[Any]]] = None):
+        self.base = base
+        self.paths = [hyperparameter.path for hyperparameter in hyperparameters]
+        if values is None:
+            values = [hyperparameter.get_values() for hyperparameter in hyperparameters]
+        self.value_tables = [list(table) for table in values]
+        self.shape = tuple(len(table) for table in self.value_tables)
+
+    def __len__(self) -> int:
+        return math.prod(self.shape)
+
+    def product(self) -> np.ndarray:
+        """Index rows of the full grid, last hyperparameter varying fastest."""
+        return np.indices(self.shape).reshape(len(self.shape), -1).T
+
+    def latin_hypercube(self, count: int, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Index rows of a Latin hypercube sample: every hyperparameter's range is cut into `count`
+        strata and each stratum is hit exactly once.
+        """
+        rng = np.random.default_rng(seed)
+        strata = np.stack([rng.permutation(count) for _ in self.shape], axis=1)
+        unit = (strata + rng.random((count, len(self.shape)))) / count
+        return self._scale(unit)
+
+    def sobol(self, count: int, seed: Optional[int] = None) -> np.ndarray:
+        """Index rows of a scrambled Sobol sample, `count` should be a power of two."""
+        from scipy.stats import qmc
+
+        unit = qmc.Sobol(d=len(self.shape), scramble=True, seed=seed).random(count)
+        return self._scale(unit)
+
+    def _scale(self, unit: np.ndarray) -> np.ndarray:
+        sizes = np.asarray(self.shape)
+        return np.minimum((unit * sizes).astype(np.int64), sizes - 1)
+
+    def values(self, row: np.ndarray) -> List[Any]:
+        return [table[index] for table, index in zip(self.value_tables, row)]
+
+    def materialize(self, row: np.ndarray):
+        configuration = copy.deepcopy(self.base)
+        for path, value in zip(self.paths, self.values(row)):
+            configuration.set_by_path(path, value)
+        return configuration
+
+    def configurations(self, rows: Optional[np.ndarray] = None, unique: bool = True) -> Iterator:
+        """
+        Lazily yields configurations for index rows, the full grid by default.
+        Duplicate rows, which samples of small tables produce, are skipped unless `unique` is False.
+        """
+        if rows is None:
+            rows = self.product()
+        elif unique:
+            _, first = np.unique(rows, axis=0, return_index=True)
+            rows = rows[np.sort(first)]
+        for row in rows:
+            yield self.materialize(row)
@@ -89,20 +89,287 @@ class BacktestGroup:
         statistics_dict = {backtest_id: backtest.get_statistics() for backtest_id, backtest in self.backtests.items()}
         return statistics_dict
 
+class ArtifactConfigCache:
+    """
+    Local cache of backtest configs stored in job artifacts.
+
+    Configs are fetched with go-getter once and stored on disk under the sha256 of the getter url,
+    next to the sha256 of the file content. A content mismatch on read is treated as a miss.
+    Entries are evicted in least-recently-used order (by mtime, refreshed on every hit) when the
+    total size exceeds `max_size_bytes`. Parsed configs are additionally memoized in process.
+
+    Attributes:
+    cache_directory (Path): Directory holding cached config files.
+    max_size_bytes (int): Upper bound on the total size of cached config files.
+    """
+    def __init__(self, cache_directory: Path, max_size_bytes: int = 256 * 1024 * 1024) -> None:
+        self.cache_directory = cache_directory
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self._parsed = {}
+
+    def get(self, getter: str) -> dict:
+        """
+        Returns the config referenced by the artifact getter url, downloading it on a miss.
+
+        Args:
+        getter (str): go-getter url of the artifact containing config.json.
+
+        Returns:
+        dict: Parsed config, a fresh copy on every call.
+        """
+        if getter not in self._parsed:
+            self._parsed[getter] = json.loads(self._read(getter))
+        return copy.deepcopy(self._parsed[getter])
+
+    def _entry_paths(self, getter: str):
+        key = hashlib.sha256(getter.encode()).hexdigest()
+        return self.cache_directory / f"{key}.json", self.cache_directory / f"{key}.sha256"
+
+    def _read(self, getter: str) -> bytes:
+        config_path, checksum_path = self._entry_paths(getter)
+        try:
+            content = config_path.read_bytes()
+            if hashlib.sha256(content).hexdigest() == checksum_path.read_text():
+                os.utime(config_path)
+                return content
+        except FileNotFoundError:
+            pass
+
+        content = self._download(getter)
+        self._write_atomic(checksum_path, hashlib.sha256(content).hexdigest().encode())
+        self._write_atomic(config_path, content)
+        self._evict()
+        return content
+
+    @staticmethod
+    def _download(getter: str) -> bytes:
+        temp_name = next(tempfile._get_candidate_names())
+        temp_name = Path(f"/tmp/{temp_name}")
+        try:
+            subprocess.run(f"go-getter \"{getter}\" {temp_name}", shell=True, check=True)
+            return (temp_name / 'config.json').read_bytes()
+        finally:
+            shutil.rmtree(temp_name, ignore_errors=True)
+
+    def _write_atomic(self, path: Path, content: bytes) -> None:
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+
+    def _evict(self) -> None:
+        entries = []
+        for config_path in self.cache_directory.glob("*.json"):
+            try:
+                stat = config_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, config_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, config_path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            config_path.unlink(missing_ok=True)
+            config_path.with_suffix(".sha256").unlink(missing_ok=True)
+            total_size -= size
+
+class BacktestResultCache:
+    """
+    Read-through cache of backtest results of successfully finished runs.
+
+    Results of a successful run never change, so they are kept forever in a local SQLite store,
+    with a bounded in-memory LRU in front of it. Misses of both levels are fetched in one bulk call.
+    Results of runs not confirmed successful, still running or failed with partial statistics,
+    are returned but never cached.
+    Returned results are shared between callers and must be treated as read-only.
+
+    Attributes:
+    database_path (Path): Location of the SQLite store.
+    memory_size (int): Maximum number of results kept in memory.
+    """
+    _query_chunk_size = 500
+
+    def __init__(self, database_path: Path, memory_size: int = 8192) -> None:
+        self.database_path = database_path
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.memory_size = memory_size
+        self._memory = collections.OrderedDict()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (run_uuid TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+
+    def get(self, run_uuid: str, fetch_many: Callable[[List[str]], dict], succeeded_runs: Callable[[List[str]], set]):
+        """
+        Returns the result of a single run, or None if it is not available yet.
+        """
+        return self.get_many([run_uuid], fetch_many, succeeded_runs).get(run_uuid)
+
+    def get_many(
+        self,
+        run_uuids: List[str],
+        fetch_many: Callable[[List[str]], dict],
+        succeeded_runs: Callable[[List[str]], set],
+    ) -> dict:
+        """
+        Returns results of the given runs, looking them up in memory, then on disk, then via `fetch_many`.
+
+        Args:
+        run_uuids (List[str]): Runs to get results for.
+        fetch_many (Callable[[List[str]], dict]): Fetches results of the given runs with a single query.
+        succeeded_runs (Callable[[List[str]], set]): Returns which of the given runs finished successfully,
+        only their fetched results are cached.
+
+        Returns:
+        dict: Results keyed by run_uuid. Runs without a result yet are omitted and not cached.
+        """
+        results = {}
+        missing = []
+        for run_uuid in dict.fromkeys(run_uuids):
+            if run_uuid in self._memory:
+                self._memory.move_to_end(run_uuid)
+                results[run_uuid] = self._memory[run_uuid]
+            else:
+                missing.append(run_uuid)
+
+        if missing:
+            stored = self._load(missing)
+            for run_uuid, result in stored.items():
+                self._remember(run_uuid, result)
+            results.update(stored)
+            missing = [run_uuid for run_uuid in missing if run_uuid not in stored]
+
+        if missing:
+            fetched = {run_uuid: result for run_uuid, result in fetch_many(missing).items() if result is not None}
+            # partial statistics of running or failed backtests must not be kept
+            succeeded = succeeded_runs(list(fetched)) if fetched else set()
+            self.put_many({run_uuid: result for run_uuid, result in fetched.items() if run_uuid in succeeded})
+            results.update(fetched)
+
+        return results
+
+    def put_many(self, results: dict) -> None:
+        """
+        Stores final results of successful runs, keyed by run_uuid.
+        """
+        self._store(results)
+        for run_uuid, result in results.items():
+            self._remember(run_uuid, result)
+
+    def _remember(self, run_uuid: str, result) -> None:
+        self._memory[run_uuid] = result
+        self._memory.move_to_end(run_uuid)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _load(self, run_uuids: List[str]) -> dict:
+        stored = {}
+        for start in range(0, len(run_uuids), self._query_chunk_size):
+            chunk = run_uuids[start:start + self._query_chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT run_uuid, result FROM results WHERE run_uuid IN ({placeholders})", chunk
+            )
+            stored.update((run_uuid, json.loads(result)) for run_uuid, result in rows)
+        return stored
+
+    def _store(self, results: dict) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results (run_uuid, result) VALUES (?, ?)",
+                [(run_uuid, json.dumps(result)) for run_uuid, result in results.items()],
+            )
+
+class NodeInfoCache:
+    """
+    Cluster node listing shared by all JobManager calls that need node information.
+
+    The listing is fetched in a background thread and reused for `ttl_seconds`. Once the listing
+    is stale it is still returned while a refresh runs in the background, so only the very first
+    call ever waits for the cluster.
+
+    Attributes:
+    ttl_seconds (float): Time after which the listing is refreshed.
+    """
+    def __init__(self, node_api, ttl_seconds: float = 30.0) -> None:
+        self._node_api = node_api
+        self.ttl_seconds = ttl_seconds
+        self._nodes = None
+        self._fetched_at = 0.0
+        self._error = None
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+
+    def refresh_in_background(self) -> None:
+        """
+        Starts fetching the node listing unless a fetch is already in progress.
+        """
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(target=self._refresh, daemon=True)
+            self._refresh_thread.start()
+
+    def _refresh(self) -> None:
+        try:
+            nodes = self._node_api.get_nodes()
+        except Exception as e:
+            self._error = e
+            return
+        with self._lock:
+            self._nodes = nodes
+            self._fetched_at = time.monotonic()
+            self._error = None
+
+    def get(self) -> dict:
+        """
+        Returns the node listing, waiting only if no listing has been fetched yet.
+        """
+        if self._nodes is None:
+            self.refresh_in_background()
+            self._refresh_thread.join()
+            if self._nodes is None:
+                raise self._error
+        elif time.monotonic() - self._fetched_at > self.ttl_seconds:
+            self.refresh_in_background()
+        return self._nodes
+
+    async def get_async(self) -> dict:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get)
+
+    # same interface as api.NodeApi, so the cache can stand in for it
+    get_nodes = get
+
 class JobManager:
-    def __init__(self, config: NomadConfig):
+    def __init__(self, config: NomadConfig, evaluation_store: Optional[EvaluationStore] = None):
         self._config = config
+        self._evaluation_store = evaluation_store
+        # run_uuid -> (config, model_hash) of submitted backtests whose statistics are not stored yet
+        self._pending_evaluations = {}
+        # run_uuid -> job_id of backtests submitted by this manager, to check they succeeded before caching results
+        self._run_jobs = {}
         self._alloc_client = api.AllocClient(config)
         self._slack_bot = SlackCommandListener(config.slack_bot_token, config.slack_channel_id)
         self._job_client = api.BacktestJobClient(config, self._alloc_client, self._slack_bot)
         self._node_api = api.NodeApi(config)
+        self._node_info = NodeInfoCache(self._node_api)
         self._optimization_results_api = api.OptimizationResultsApi(config.clickhouse_config)
+        self._artifact_config_cache = ArtifactConfigCache(Path(f"/tmp/{getpass.getuser()}/artifacts/configs"))
+        self._backtest_result_cache = BacktestResultCache(Path(f"/tmp/{getpass.getuser()}/results/results.sqlite"))
+        # (allocation id, byte offset) and unterminated trailing bytes of followed logs, keyed by (job_id, log_type)
+        self._log_offsets = {}
+        self._log_partial_lines = {}
+        self._log_task_names = {}
         # self._all_jobs = []
         # self._thread_pool = ThreadPool(self._config.upload_pool_size)
         # atexit.register(self.shutdown)
 
-        if len(config.servers) > 0:
-            self._verify_servers_list()
+        # servers are verified lazily on first use or in start(), node listing is prefetched meanwhile
+        self._servers_verified = len(config.servers) == 0
+        if not self._servers_verified:
+            self._node_info.refresh_in_background()
 
     def cache_artifact(self, tag, path):
         minio_upload_config = self._config.minio_config
@@ -126,8 +393,18 @@ class JobManager:
         Path(temp_name).unlink(missing_ok=True)
 
     def _verify_servers_list(self):
-        nodes = self._node_api.get_nodes()
-        
+        if self._servers_verified:
+            return
+        self._check_servers(self._node_info.get())
+        self._servers_verified = True
+
+    async def _verify_servers_list_async(self):
+        if self._servers_verified:
+            return
+        self._check_servers(await self._node_info.get_async())
+        self._servers_verified = True
+
+    def _check_servers(self, nodes):
         for server in self._config.servers:
             if server not in nodes:
                 raise RuntimeError(f"Server {server} unrecognized, verify that server present in cluster")
@@ -139,7 +416,8 @@ class JobManager:
     def get_total_cores(self):
         if len(self._config.servers) == 0:
             raise RuntimeError("Use this method only with server list specified")
-        nodes = self._node_api.get_nodes()
+        self._verify_servers_list()
+        nodes = self._node_info.get()
 
         total_cores = 0
         for server in self._config.servers:
@@ -160,6 +438,7 @@ class JobManager:
         tasks = []
         # start slack bot first
         tasks.append(self._slack_bot.start(poll_loop=False))
+        tasks.append(self._verify_servers_list_async())
 
         if poll_loop:
             tasks.append(self._run_poll_loop(restart_policy))
@@ -169,23 +448,80 @@ class JobManager:
     def stop(self, job_id):
         return self._job_client.delete_job(job_id)
 
-    def submit_backtests(self, configs, tags_entries, run_uuids):
-        jobs = []
-        for config, tags, run_uuid in zip(configs, tags_entries, run_uuids):
-            job = self.submit_backtest(config, tags, run_uuid)
-
-            jobs.append(job)
+    def submit_backtests(self, configs, tags_entries, run_uuids, model_hash=None, predictor=None):
+        """
+        Submits backtests. With an evaluation store and `model_hash`, configs already evaluated against
+        the same model are not submitted: their job is None and get_backtest_result(run_uuid)
+        returns the stored statistics. With a runtime `predictor`, backtests are submitted longest
+        predicted runtime first. Jobs are returned in input order either way.
 
+        Returns:
+        list or tuple: Submitted jobs, with a `predictor` a tuple of the jobs and the predicted makespan
+        in seconds of the submitted backtests on the cores of config.servers (one core per backtest
+        without servers), for wait_for_job_list_with_makespan.
+        """
+        store = self._evaluation_store if model_hash is not None else None
+        cached, to_run = split_cached(store, configs, model_hash)
+        if predictor is not None:
+            predicted = {index: predictor.predict(configs[index]) for index in to_run}
+            to_run.sort(key=predicted.get, reverse=True)
+            slots = self.get_total_cores() if len(self._config.servers) > 0 else len(to_run)
+            predicted_makespan = lpt_makespan(predicted.values(), max(slots, 1))
+        self._backtest_result_cache.put_many({run_uuids[index]: statistics for index, statistics in cached.items()})
+
+        jobs = [None] * len(configs)
+        for index in to_run:
+            jobs[index] = self.submit_backtest(configs[index], tags_entries[index], run_uuids[index])
+            if store is not None:
+                self._pending_evaluations[run_uuids[index]] = (configs[index], model_hash)
+
+        if predictor is not None:
+            return jobs, predicted_makespan
         return jobs
 
+    def submit_backtests_scheduled(self, configs, tags_entries, run_uuids, history, poll_interval=5.0):
+        """
+        Submits backtests longest predicted runtime first, never exceeding free cores of config.servers.
+        Cores taken by other running jobs of the same prefix are subtracted, checked on every poll.
+        `history` is a RuntimeHistory or a RuntimePredictor.
+        Placement of each job is still decided by Nomad, planned nodes are used for the makespan estimate.
+
+        Returns:
+        tuple: Submitted jobs in input order and the expected makespan in seconds.
+        """
+        scheduler = CapacityScheduler(self._node_info, self._config.servers, history)
+        plan = scheduler.plan(configs)
+        jobs = [None] * len(configs)
+
+        def submit(backtest):
+            jobs[backtest.index] = self.submit_backtest(
+                backtest.config, tags_entries[backtest.index], run_uuids[backtest.index]
+            )
+            return jobs[backtest.index]
+
+        def is_finished(job):
+            return self.is_finished_job(self.get_job_status(job.job_id))
+
+        def busy_slots(running):
+            return len(self.get_running_jobs().keys() - {job.job_id for job in running})
+
+        scheduler.run(plan, submit, is_finished, poll_interval, busy_slots=busy_slots)
+        return jobs, plan.makespan
+
     def submit_backtest(self, backtest_config, tags, run_uuid):
-        return self._job_client.submit_backtest(backtest_config, tags, run_uuid)
+        self._verify_servers_list()
+        with tracing.span("job_manager.submit_backtest", run_uuid=run_uuid):
+            job = self._job_client.submit_backtest(backtest_config, tags, run_uuid)
+        self._run_jobs[run_uuid] = job.job_id
+        return job
 
     def get_allocation_id(self, job_id):
         return self._job_client.get_allocation_id(job_id)
 
     def get_job_status(self, job_id):
-        return self._job_client.get_job_status(job_id)
+        tracing.increment("job_manager.status_polls")
+        with tracing.span("job_manager.get_job_status"):
+            return self._job_client.get_job_status(job_id)
 
     def is_finished_job(self, job_status):
         return self._job_client.is_finished_job(job_status)
@@ -199,14 +535,162 @@ class JobManager:
     def wait_for_job_list_with_restart(self, job_list, restart_policy=None):
         return self._job_client.wait_for_job_list_with_restart(job_list, restart_policy)
 
-    def get_backtest_result(self, run_uuid):
+    def wait_for_job_list_with_makespan(self, job_list, predicted_makespan, submitted_at, restart_policy=None):
+        """
+        Waits for the jobs and reports the predicted against the actual makespan,
+        `submitted_at` is the time.monotonic() taken before the first submission.
+        """
+        result = self.wait_for_job_list_with_restart(job_list, restart_policy)
+        report = MakespanReport(predicted=predicted_makespan, actual=time.monotonic() - submitted_at)
+        print(f"Jobs finished: {report}")
+        return result, report
+
+    def get_backtest_result(self, run_uuid, succeeded=False):
+        return self.get_backtest_results([run_uuid], succeeded).get(run_uuid)
+
+    def _fetch_backtest_results(self, run_uuids):
+        tracing.increment("job_manager.result_queries")
+        tracing.increment("job_manager.results_fetched", len(run_uuids))
+        with tracing.span("job_manager.fetch_backtest_results", count=len(run_uuids)):
+            get_many = getattr(self._optimization_results_api, "get_backtest_results", None)
+            if get_many is not None:
+                return get_many(run_uuids)
+            # clients without the bulk IN query are asked run by run
+            return {run_uuid: self._optimization_results_api.get_backtest_result(run_uuid) for run_uuid in run_uuids}
+
+    def _succeeded_runs(self, run_uuids):
+        succeeded = set()
+        for run_uuid in run_uuids:
+            job_id = self._run_jobs.get(run_uuid)
+            # failed, killed or pruned jobs leave partial statistics behind, only successful ones are final
+            if job_id is not None and self.is_finished_job(self.get_job_status(job_id)) and self.is_success_job(job_id):
+                succeeded.add(run_uuid)
+        return succeeded
+
+    def get_interim_backtest_result(self, run_uuid):
+        # statistics of a running backtest still change, so they bypass the result cache
         return self._optimization_results_api.get_backtest_result(run_uuid)
 
+    def get_backtest_results(self, run_uuids, succeeded=False):
+        """
+        Returns results of the given runs keyed by run_uuid. Results are cached once their job succeeded:
+        `succeeded=True` tells all jobs are known to have succeeded, otherwise jobs submitted by this manager
+        are checked by their status and results of other runs are not cached.
+        """
+        unconfirmed_runs = set()
+
+        def succeeded_runs(fetched_run_uuids):
+            succeeded_run_uuids = set(fetched_run_uuids) if succeeded else self._succeeded_runs(fetched_run_uuids)
+            unconfirmed_runs.update(set(fetched_run_uuids) - succeeded_run_uuids)
+            return succeeded_run_uuids
+
+        with tracing.span("job_manager.get_backtest_results", count=len(run_uuids)):
+            results = self._backtest_result_cache.get_many(run_uuids, self._fetch_backtest_results, succeeded_runs)
+        for run_uuid in (results.keys() - unconfirmed_runs) & self._pending_evaluations.keys():
+            config, model_hash = self._pending_evaluations.pop(run_uuid)
+            self._evaluation_store.put(config, model_hash, results[run_uuid])
+        return results
+
     def get_job_logs(self, job_id, log_type="stderr"):
         return self._job_client.get_job_logs(job_id, log_type)
 
+    def _nomad_get(self, endpoint, **params):
+        headers = {}
+        if self._config.nomad_token is not None:
+            headers["X-Nomad-Token"] = self._config.nomad_token
+        if self._config.nomad_namespace is not None:
+            params["namespace"] = self._config.nomad_namespace
+        response = requests.get(f"{self._config.nomad_server}{endpoint}", headers=headers, params=params)
+        response.raise_for_status()
+        return response
+
+    def _log_task_name(self, job_id):
+        if job_id not in self._log_task_names:
+            self._log_task_names[job_id] = self.get_job_json(job_id)["TaskGroups"][0]["Tasks"][0]["Name"]
+        return self._log_task_names[job_id]
+
+    def _log_size(self, alloc_id, task, log_type):
+        # the log of a task is split over rotated files named <task>.<log_type>.<index>
+        files = self._nomad_get(f"/v1/client/fs/ls/{alloc_id}", path="alloc/logs").json()
+        return sum(file["Size"] for file in files if file["Name"].startswith(f"{task}.{log_type}."))
+
+    def get_new_job_log_lines(self, job_id, log_type="stderr", pattern=None):
+        """
+        Returns complete log lines written since the previous call for the same job and log type.
+        Only the bytes appended since then are downloaded. A job restarted in a new allocation,
+        or a log that got shorter (rotated or truncated), is read again from its start.
+
+        Args:
+        job_id (str): Job to read logs of.
+        log_type (str): "stderr" or "stdout".
+        pattern (Optional[str]): Regular expression, only matching lines are returned.
+
+        Returns:
+        List[str]: New lines without trailing newlines.
+        """
+        key = (job_id, log_type)
+        alloc_id = self.get_allocation_id(job_id)
+        task = self._log_task_name(job_id)
+        followed_alloc_id, offset = self._log_offsets.get(key, (alloc_id, 0))
+        size = self._log_size(alloc_id, task, log_type)
+        if followed_alloc_id != alloc_id or size < offset:
+            offset = 0
+            self._log_partial_lines.pop(key, None)
+        self._log_offsets[key] = (alloc_id, offset)
+        if size == offset:
+            return []
+
+        chunk = self._nomad_get(
+            f"/v1/client/fs/logs/{alloc_id}", task=task, type=log_type, origin="start", offset=offset, plain="true"
+        ).content
+        self._log_offsets[key] = (alloc_id, offset + len(chunk))
+
+        lines = (self._log_partial_lines.pop(key, b"") + chunk).split(b"\n")
+        if lines[-1]:
+            self._log_partial_lines[key] = lines[-1]
+        # split on bytes, so a multi-byte character cut at the end of a chunk is decoded once complete
+        lines = [line.decode(errors="replace") for line in lines[:-1]]
+
+        if pattern is not None:
+            regex = re.compile(pattern)
+            lines = [line for line in lines if regex.search(line)]
+        return lines
+
+    async def follow_job_logs(self, job_ids, log_type="stderr", pattern=None, poll_interval=2.0):
+        """
+        Yields (job_id, line) for new log lines of many jobs until all of them are finished.
+        Every poll round fetches only the bytes appended since the previous round, all jobs concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        following = list(job_ids)
+        while following:
+            finished = await asyncio.gather(*(
+                loop.run_in_executor(None, lambda job_id=job_id: self.is_finished_job(self.get_job_status(job_id)))
+                for job_id in following
+            ))
+            # logs are read after the status check, so the last round of a finished job is complete
+            new_lines = await asyncio.gather(*(
+                loop.run_in_executor(None, self.get_new_job_log_lines, job_id, log_type, pattern)
+                for job_id in following
+            ))
+            for job_id, lines in zip(following, new_lines):
+                for line in lines:
+                    yield job_id, line
+
+            for job_id, is_finished in zip(following, finished):
+                if is_finished:
+                    partial_line = self._log_partial_lines.pop((job_id, log_type), b"").decode(errors="replace")
+                    if partial_line and (pattern is None or re.search(pattern, partial_line)):
+                        yield job_id, partial_line
+            following = [job_id for job_id, is_finished in zip(following, finished) if not is_finished]
+            if following:
+                await asyncio.sleep(poll_interval)
+
+    def get_job_ids(self):
+        return self._job_client.get_jobs_by_prefix(self._config.unique_prefix)
+
     def get_running_jobs(self):
-        job_ids = self._job_client.get_jobs_by_prefix(self._config.unique_prefix)
+        job_ids = self.get_job_ids()
         res = {}
         for job_id in job_ids:
             try:
@@ -249,15 +733,7 @@ class JobManager:
                 if 'stream_backtester_config' not in key:
                     continue
 
-                temp_name = next(tempfile._get_candidate_names())
-                temp_name = Path(f"/tmp/{temp_name}")
-
-                p = subprocess.run(f"go-getter \"{info['getter']}\" {temp_name}", shell=True, check=True)
-
-                with open(temp_name / 'config.json', 'r') as f:
-                    backtest_config = json.load(f)
-
-                shutil.rmtree(temp_name)
+                backtest_config = self._artifact_config_cache.get(info['getter'])
 
                 break
 
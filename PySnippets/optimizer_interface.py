@@ -58,3 +58,180 @@ class Optimizer:
 
 
 
+
+
+class EvaluationRunner(ABC):
+    """
+    Runs a single configuration to completion and returns its result.
+    """
+
+    @abstractmethod
+    async def evaluate(self, configuration, run_uuid: Optional[str] = None):
+        pass
+
+
+class BacktestGroupRunner(EvaluationRunner):
+    """
+    Runs every configuration as a local backtest process.
+    """
+
+    def __init__(self, source_model_path: Path, logging_directory: Path):
+        self.source_model_path = source_model_path
+        self.logging_directory = logging_directory
+
+    async def evaluate(self, configuration, run_uuid: Optional[str] = None):
+        # group ids only differ by the second, a directory per run keeps evaluations of the same config apart
+        logging_directory = self.logging_directory / (run_uuid or str(uuid.uuid4()))
+        group = BacktestGroup([configuration], self.source_model_path, logging_directory)
+        group.start()
+        await asyncio.get_running_loop().run_in_executor(None, group.wait)
+        (statistics,) = group.statistics.values()
+        return statistics
+
+
+class JobManagerRunner(EvaluationRunner):
+    """
+    Runs every configuration as a Nomad job and fetches its result from ClickHouse.
+    """
+
+    def __init__(self, job_manager: JobManager, tags: dict, poll_interval: float = 10.0):
+        self.job_manager = job_manager
+        self.tags = tags
+        self.poll_interval = poll_interval
+
+    async def evaluate(self, configuration, run_uuid: Optional[str] = None):
+        loop = asyncio.get_running_loop()
+        run_uuid = run_uuid or str(uuid.uuid4())
+        job = await loop.run_in_executor(
+            None, self.job_manager.submit_backtest, configuration, self.tags, run_uuid
+        )
+        return await self.wait(run_uuid, job)
+
+    async def wait(self, run_uuid: str, job):
+        """Waits for a submitted job, also one re-attached after a restart, and returns its result."""
+        loop = asyncio.get_running_loop()
+        while True:
+            status = await loop.run_in_executor(None, self.job_manager.get_job_status, job.job_id)
+            if self.job_manager.is_finished_job(status):
+                break
+            await asyncio.sleep(self.poll_interval)
+        # statistics of a failed job are partial and must not be cached as its result
+        succeeded = await loop.run_in_executor(None, self.job_manager.is_success_job, job.job_id)
+        return await loop.run_in_executor(None, self.job_manager.get_backtest_result, run_uuid, succeeded)
+
+
+class AsyncOptimizer(ABC):
+    """
+    Optimizer keeping `max_in_flight` evaluations running at all times.
+    A new candidate is proposed as soon as any evaluation finishes, instead of
+    waiting for the whole batch, as in asynchronous successive halving or
+    asynchronous Bayesian optimization.
+    With a `journal`, evaluations are journaled and a restarted optimizer resumes from it, see JournaledRunner.
+    The state returned by `get_state` is journaled after every observation and restored with `set_state`
+    when a restarted optimizer starts.
+    """
+
+    def __init__(self, runner: EvaluationRunner, max_in_flight: int, journal: Optional[OptimizationJournal] = None):
+        self.journal = journal
+        self.runner = JournaledRunner(runner, journal) if journal is not None else runner
+        self.max_in_flight = max_in_flight
+
+    @abstractmethod
+    def propose(self):
+        """
+        Returns the next configuration to evaluate given results observed so far,
+        or None if there is nothing to propose until more results arrive.
+        """
+        pass
+
+    @abstractmethod
+    def observe(self, configuration, result):
+        pass
+
+    @abstractmethod
+    def stop_condition(self) -> bool:
+        pass
+
+    def get_state(self):
+        """JSON-serializable state to journal, None if the optimizer has nothing to checkpoint."""
+        return None
+
+    def set_state(self, state) -> None:
+        pass
+
+    async def optimize(self):
+        if self.journal is not None and self.runner.state.generator_state is not None:
+            self.set_state(self.runner.state.generator_state)
+
+        in_flight = {}
+        while True:
+            while len(in_flight) < self.max_in_flight and not self.stop_condition():
+                configuration = self.propose()
+                if configuration is None:
+                    break
+                in_flight[asyncio.ensure_future(self.runner.evaluate(configuration))] = configuration
+
+            if not in_flight:
+                return
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            try:
+                for task in done:
+                    self.observe(in_flight.pop(task), task.result())
+                    state = self.get_state() if self.journal is not None else None
+                    if state is not None:
+                        self.journal.record_generator_state(state)
+            except BaseException:
+                for task in in_flight:
+                    task.cancel()
+                raise
+
+
+class TPEOptimizer(AsyncOptimizer):
+    """
+    Asynchronous optimizer proposing one configuration per free slot with a TPEGenerator.
+    With a journal, the generator state is checkpointed after every observation, so a restarted
+    optimizer proposes the rows that were in flight again, served from the journal, and continues
+    with the same random sequence.
+
+    Attributes:
+    generator (TPEGenerator): Candidate generator over the hyperparameter grid.
+    score (Callable[[Any], float]): Metric of a result, as the generator's `maximize` expects it.
+    max_evaluations (int): Number of configurations to evaluate in total.
+    """
+
+    def __init__(
+        self,
+        runner: EvaluationRunner,
+        generator: TPEGenerator,
+        score: Callable[[Any], float],
+        max_evaluations: int,
+        max_in_flight: int,
+        journal: Optional[OptimizationJournal] = None,
+    ):
+        super().__init__(runner, max_in_flight, journal)
+        self.generator = generator
+        self.score = score
+        self.max_evaluations = max_evaluations
+        # config_hash -> grid row of proposed configurations
+        self._rows = {}
+
+    def propose(self):
+        rows = self.generator.propose(1)
+        if len(rows) == 0:
+            return None
+        configuration = self.generator.grid.materialize(rows[0])
+        self._rows[config_hash(configuration)] = rows[0]
+        return configuration
+
+    def observe(self, configuration, result):
+        self.generator.observe(self._rows.pop(config_hash(configuration)), self.score(result))
+
+    def stop_condition(self) -> bool:
+        return self.generator.evaluation_count >= self.max_evaluations
+
+    def get_state(self):
+        return self.generator.get_state()
+
+    def set_state(self, state) -> None:
+        self.generator.set_state(state)
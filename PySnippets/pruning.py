@@ -0,0 +1,174 @@
+import asyncio
+import math
+import statistics
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class Pruner(ABC):
+    """
+    Decides from intermediate values whether a running backtest should be stopped.
+    Values are compared as "higher is better" unless `maximize` is False.
+    """
+
+    def __init__(self, maximize: bool = True):
+        self.maximize = maximize
+
+    def _score(self, value: float) -> float:
+        return value if self.maximize else -value
+
+    @abstractmethod
+    def report(self, trial_id: Hashable, step: int, value: float) -> bool:
+        """
+        Records an intermediate value of a trial.
+
+        Returns:
+        bool: True if the trial should be stopped.
+        """
+        pass
+
+
+class MedianPruner(Pruner):
+    """
+    Stops a trial whose best value so far is worse than the median of the other trials at the same step.
+    """
+
+    def __init__(self, warmup_steps: int = 0, min_trials: int = 5, maximize: bool = True):
+        super().__init__(maximize)
+        self.warmup_steps = warmup_steps
+        self.min_trials = min_trials
+        self._best: Dict[Hashable, float] = {}
+        self._scores_at_step: Dict[int, Dict[Hashable, float]] = {}
+
+    def report(self, trial_id: Hashable, step: int, value: float) -> bool:
+        score = max(self._best.get(trial_id, -math.inf), self._score(value))
+        self._best[trial_id] = score
+        others = self._scores_at_step.setdefault(step, {})
+        others[trial_id] = score
+        if step < self.warmup_steps or len(others) < self.min_trials:
+            return False
+        return score < statistics.median(others.values())
+
+
+class SuccessiveHalvingPruner(Pruner):
+    """
+    Asynchronous successive halving (ASHA).
+
+    Rungs are placed at steps `min_step * reduction_factor ** k`. A trial reaching a rung continues
+    only if its value is within the top `1 / reduction_factor` of all values recorded at that rung so far,
+    so decisions never wait for other trials to catch up.
+    """
+
+    def __init__(self, min_step: int = 1, reduction_factor: int = 3, maximize: bool = True):
+        super().__init__(maximize)
+        self.min_step = min_step
+        self.reduction_factor = reduction_factor
+        self._rungs: Dict[int, Dict[Hashable, float]] = {}
+
+    def _rung(self, step: int) -> Optional[int]:
+        if step < self.min_step:
+            return None
+        return int(math.log(step / self.min_step, self.reduction_factor) + 1e-9)
+
+    def report(self, trial_id: Hashable, step: int, value: float) -> bool:
+        rung = self._rung(step)
+        if rung is None:
+            return False
+        scores = self._rungs.setdefault(rung, {})
+        if trial_id in scores:
+            return False
+        scores[trial_id] = self._score(value)
+        promoted = max(1, len(scores) // self.reduction_factor)
+        return scores[trial_id] < sorted(scores.values(), reverse=True)[promoted - 1]
+
+
+class PruningMonitor:
+    """
+    Polls intermediate statistics of running backtests, reports them to a pruner and stops the losers.
+
+    Attributes:
+    pruner (Pruner): Pruning rule.
+    pruned (List[Hashable]): Ids of stopped backtests, in the order they were stopped.
+    """
+
+    def __init__(
+        self,
+        pruner: Pruner,
+        fetch_statistics: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        is_running: Callable[[Hashable], bool],
+        stop: Callable[[Hashable], Any],
+        metric: Callable[[Any], Optional[Tuple[int, float]]],
+        poll_interval: float = 30.0,
+    ):
+        self.pruner = pruner
+        self.pruned = []
+        self._fetch_statistics = fetch_statistics
+        self._is_running = is_running
+        self._stop = stop
+        self._metric = metric
+        self.poll_interval = poll_interval
+
+    @classmethod
+    def for_backtest_group(cls, group, pruner: Pruner, metric, poll_interval: float = 30.0) -> "PruningMonitor":
+        def fetch_statistics(backtest_ids):
+            # group.statistics is rebuilt on every access, read it once per poll
+            statistics = group.statistics
+            return {backtest_id: statistics.get(backtest_id) for backtest_id in backtest_ids}
+
+        def is_running(backtest_id):
+            # backtests served from the evaluation store have no process
+            process = group.processes.get(backtest_id)
+            return process is not None and process.is_alive()
+
+        return cls(
+            pruner,
+            fetch_statistics=fetch_statistics,
+            is_running=is_running,
+            stop=group.stop_instance,
+            metric=metric,
+            poll_interval=poll_interval,
+        )
+
+    @classmethod
+    def for_jobs(cls, job_manager, run_uuids: Dict[str, str], pruner: Pruner, metric, poll_interval: float = 30.0) -> "PruningMonitor":
+        """
+        Monitor for Nomad jobs, `run_uuids` maps job ids to the run uuids their statistics are written under.
+        """
+        return cls(
+            pruner,
+            fetch_statistics=lambda job_ids: {
+                job_id: job_manager.get_interim_backtest_result(run_uuids[job_id]) for job_id in job_ids
+            },
+            is_running=lambda job_id: not job_manager.is_finished_job(job_manager.get_job_status(job_id)),
+            stop=job_manager.stop,
+            metric=metric,
+            poll_interval=poll_interval,
+        )
+
+    def poll(self, ids: Iterable[Hashable]) -> List[Hashable]:
+        """
+        Reports the latest statistics of the given running backtests once.
+
+        Returns:
+        List[Hashable]: Ids that are still running and were not pruned.
+        """
+        running = [backtest_id for backtest_id in ids if self._is_running(backtest_id)]
+        for backtest_id, backtest_statistics in self._fetch_statistics(running).items():
+            if backtest_statistics is None:
+                continue
+            measurement = self._metric(backtest_statistics)
+            if measurement is not None and self.pruner.report(backtest_id, *measurement):
+                self._stop(backtest_id)
+                self.pruned.append(backtest_id)
+                running.remove(backtest_id)
+        return running
+
+    async def run(self, ids: Iterable[Hashable]) -> List[Hashable]:
+        """Polls until none of the backtests is running anymore, returns the pruned ids."""
+        loop = asyncio.get_running_loop()
+        running = list(ids)
+        while running:
+            running = await loop.run_in_executor(None, self.poll, running)
+            if running:
+                await asyncio.sleep(self.poll_interval)
+        return self.pruned
@@ -1,33 +1,274 @@
+"""
+Strips docstrings from Python sources in place, for whole trees.
+
+Docstrings are found with `tokenize`, so only the first string statement of a module, class or
+function body is removed; other multi-line strings are left alone. A docstring that is the only
+statement of a class or function body is replaced with `pass`. Files are tokenized and rewritten
+line by line, in a process pool, and replaced atomically. A manifest of mtimes and hashes of
+already stripped files lets repeated runs skip files that did not change since.
+
+Usage: python remove_docstrings.py <path> [<path> ...] [--manifest PATH] [--workers N]
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
 import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, TextIO
+
+MANIFEST_NAME = ".remove_docstrings.json"
+
+
+class Edit(NamedTuple):
+    start_row: int
+    start_col: int
+    end_row: int
+    end_col: int
+    replacement: str
+
+
+def _docstring_edit(strings: list, newline_row: int, only_statement: bool) -> Edit:
+    start_row, start_col = strings[0].start
+    end_row, end_col = strings[-1].end
+    if only_statement:
+        # the body would be empty without it
+        return Edit(start_row, start_col, end_row, end_col, "pass")
+    # the docstring is the first statement of its logical line: drop its lines, a trailing comment included
+    return Edit(start_row, 0, newline_row + 1, 0, "")
+
+
+def docstring_edits(readline) -> Iterator[Edit]:
+    """
+    Yields the edits removing docstrings from the source read by `readline`, in source order.
+    Reads lazily, so the edits of a file can be applied while it is still being tokenized.
+    """
+    expect_docstring = True  # the next statement opens a module, class or function body
+    in_body = False  # that body is a class or function one, not the module
+    inline = False  # the body is on the header line, `def f(): "doc"`
+    after_colon = False  # the previous token is the colon ending a class or function header
+    line_start = True
+    first_name = None
+    header = False
+    depth = 0
+    strings = []
+    pending = None
+
+    for token in tokenize.generate_tokens(readline):
+        kind = token.type
+        if kind in (tokenize.NL, tokenize.COMMENT):
+            continue
+
+        if pending is not None:
+            pending_strings, newline_row, pending_in_body, pending_inline = pending
+            only_statement = pending_inline or (pending_in_body and kind in (tokenize.DEDENT, tokenize.ENDMARKER))
+            yield _docstring_edit(pending_strings, newline_row, only_statement)
+            pending = None
+
+        if strings:
+            if kind == tokenize.STRING:
+                strings.append(token)
+                continue
+            if kind == tokenize.NEWLINE:
+                pending = (strings, token.start[0], in_body, inline)
+                strings = []
+                expect_docstring = False
+                line_start = True
+                continue
+            # a string expression such as `"a" + b`, not a docstring
+            strings = []
+
+        if expect_docstring and kind == tokenize.STRING:
+            strings = [token]
+            inline = after_colon
+            after_colon = False
+            continue
+        if kind in (tokenize.INDENT, tokenize.DEDENT):
+            continue
+        if kind == tokenize.NEWLINE:
+            # a header ending the line opens an indented body
+            expect_docstring = after_colon
+            after_colon = False
+            header = False
+            line_start = True
+            depth = 0
+            continue
+        expect_docstring = False
+        after_colon = False
+
+        if line_start:
+            line_start = False
+            first_name = token.string
+            header = token.string in ("def", "class")
+        elif first_name == "async" and not header and depth == 0 and token.string == "def":
+            header = True
+
+        if kind == tokenize.OP:
+            if token.string in "([{":
+                depth += 1
+            elif token.string in ")]}":
+                depth -= 1
+            elif token.string == ":" and header and depth == 0:
+                header = False
+                after_colon = True
+                expect_docstring = True
+                in_body = True
+
+
+def _apply_edits(source: TextIO, target: TextIO, edits: Iterable[Edit]) -> int:
+    """Copies `source` to `target` line by line with the edits applied. Returns the number of edits."""
+    edits = iter(edits)
+    edit = next(edits, None)
+    current = None
+    count = 0
+    for row, line in enumerate(source, 1):
+        col = 0
+        while True:
+            if current is not None:
+                if current.end_row > row:
+                    break
+                col = current.end_col
+                current = None
+                edit = next(edits, None)
+                continue
+            if edit is not None and edit.start_row == row:
+                target.write(line[col:edit.start_col])
+                target.write(edit.replacement)
+                current = edit
+                count += 1
+                continue
+            target.write(line[col:])
+            break
+    return count
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def strip_file(path: Path) -> bool:
+    """
+    Removes docstrings from one file in place. The file is only replaced when something was removed.
+
+    Returns:
+    bool: Whether the file was changed.
+    """
+    with open(path, "rb") as file:
+        encoding, _ = tokenize.detect_encoding(file.readline)
+
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(path, encoding=encoding, newline="") as tokenized, open(path, encoding=encoding, newline="") as source:
+            with open(temp_path, "w", encoding=encoding, newline="") as target:
+                count = _apply_edits(source, target, docstring_edits(tokenized.readline))
+        if count == 0:
+            temp_path.unlink()
+            return False
+        shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+        return True
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 def remove_multiline_comments(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-
-    in_comment = False
-    cleaned_lines = []
-
-    for line in lines:
-        if not in_comment:
-            if line.strip().startswith("'''") or line.strip().startswith('"""'):
-                in_comment = True
-                if line.strip().endswith("'''") or line.strip().endswith('"""'):  # single-line comment
-                    in_comment = False
-                else:
-                    continue  # skip line
+    strip_file(Path(file_path))
+
+
+def _strip_and_stat(path: str) -> tuple:
+    """Pool worker: strips a file and returns its manifest entry, or the error for files that do not tokenize."""
+    try:
+        changed = strip_file(Path(path))
+    except (SyntaxError, tokenize.TokenError, UnicodeDecodeError) as e:
+        return path, None, f"{type(e).__name__}: {e}"
+    stat = os.stat(path)
+    return path, {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": file_hash(Path(path))}, changed
+
+
+def load_manifest(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def store_manifest(path: Path, manifest: Dict[str, dict]) -> None:
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(temp_path, path)
+
+
+def iter_sources(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.rglob("*.py"))
         else:
-            if line.strip().endswith("'''") or line.strip().endswith('"""'):
-                in_comment = False
-            continue  # skip line
-        cleaned_lines.append(line)
+            yield path
 
-    with open(file_path, 'w', encoding='utf-8') as file:
-        file.writelines(cleaned_lines)
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python script.py <file-path>")
-        sys.exit(1)
-    file_path = sys.argv[1]
-    remove_multiline_comments(file_path)
+def is_unchanged(path: Path, entry: Optional[dict]) -> bool:
+    """
+    A file is unchanged since it was stripped if its mtime and size match the manifest, or, when only
+    the mtime moved (checkouts, copies), if its content hash does.
+    """
+    if entry is None:
+        return False
+    stat = path.stat()
+    if stat.st_size != entry["size"]:
+        return False
+    if stat.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    if file_hash(path) == entry["sha256"]:
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+    return False
+
+
+def strip_tree(paths: Iterable[Path], manifest_path: Path, workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Strips docstrings from all Python files under `paths`, skipping those recorded in the manifest as unchanged.
+
+    Returns:
+    Dict[str, int]: Counts of skipped, unchanged, stripped and failed files.
+    """
+    manifest = load_manifest(manifest_path)
+    counts = {"skipped": 0, "unchanged": 0, "stripped": 0, "failed": 0}
+    to_strip = []
+    for path in iter_sources(paths):
+        key = str(path.resolve())
+        if is_unchanged(path, manifest.get(key)):
+            counts["skipped"] += 1
+        else:
+            to_strip.append(key)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path, entry, result in executor.map(_strip_and_stat, to_strip, chunksize=16):
+            if entry is None:
+                counts["failed"] += 1
+                manifest.pop(path, None)
+                print(f"{path}: {result}", file=sys.stderr)
+                continue
+            manifest[path] = entry
+            counts["stripped" if result else "unchanged"] += 1
+
+    store_manifest(manifest_path, manifest)
+    return counts
 
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Strip docstrings from Python files and directories in place.")
+    parser.add_argument("paths", nargs="+", type=Path)
+    parser.add_argument("--manifest", type=Path, default=None, help=f"defaults to {MANIFEST_NAME} in the current directory")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    counts = strip_tree(args.paths, args.manifest or Path(MANIFEST_NAME), args.workers)
+    print(", ".join(f"{count} {name}" for name, count in counts.items()))
+    sys.exit(1 if counts["failed"] else 0)
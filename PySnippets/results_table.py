@@ -0,0 +1,104 @@
+from typing import Any, Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+
+class ResultsTable:
+    """
+    Columnar store of optimizer results, hyperparameter values and metrics side by side.
+
+    Rows live in a NumPy structured array that grows by doubling, so appending streamed
+    results is amortized O(1) and every query works on whole columns at once.
+
+    Example:
+        table = ResultsTable({"backtest_id": "U64", "window": "i8", "sharpe": "f8", "drawdown": "f8"})
+        table.extend(rows)
+        table.top_k("sharpe", 10)
+        table.pareto_front(["sharpe", "drawdown"], maximize=[True, False])
+        table.groupby("window", "sharpe", "mean")
+    """
+
+    _aggregations = ("count", "sum", "mean", "min", "max")
+
+    def __init__(self, columns: Dict[str, Any], capacity: int = 1024):
+        self.dtype = np.dtype(list(columns.items()))
+        self._rows = np.empty(capacity, dtype=self.dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def rows(self) -> np.ndarray:
+        """View of the filled rows, valid until the next append."""
+        return self._rows[: self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.rows[name]
+
+    def _reserve(self, count: int) -> None:
+        if self._size + count <= len(self._rows):
+            return
+        capacity = max(len(self._rows) * 2, self._size + count)
+        rows = np.empty(capacity, dtype=self.dtype)
+        rows[: self._size] = self._rows[: self._size]
+        self._rows = rows
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self._reserve(1)
+        self._rows[self._size] = tuple(row[name] for name in self.dtype.names)
+        self._size += 1
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        records = np.array([tuple(row[name] for name in self.dtype.names) for row in rows], dtype=self.dtype)
+        self._reserve(len(records))
+        self._rows[self._size : self._size + len(records)] = records
+        self._size += len(records)
+
+    def top_k(self, column: str, k: int, largest: bool = True) -> np.ndarray:
+        """Rows with the k largest (or smallest) values of the column, best first."""
+        values = self.column(column)
+        keys = -values if largest else values
+        k = min(k, len(values))
+        if k == 0:
+            return self.rows[:0]
+        selected = np.argpartition(keys, k - 1)[:k]
+        return self.rows[selected[np.argsort(keys[selected], kind="stable")]]
+
+    def pareto_front(self, columns: Sequence[str], maximize: Sequence[bool]) -> np.ndarray:
+        """Rows not dominated by any other row over the given columns."""
+        costs = np.stack(
+            [-self.column(name) if is_max else self.column(name) for name, is_max in zip(columns, maximize)],
+            axis=1,
+        ).astype(np.float64)
+        efficient = np.arange(len(costs))
+        next_index = 0
+        while next_index < len(costs):
+            # keep rows better than the current one in at least one objective, and the current row itself
+            keep = np.any(costs < costs[next_index], axis=1)
+            keep[next_index] = True
+            efficient = efficient[keep]
+            costs = costs[keep]
+            next_index = np.count_nonzero(keep[:next_index]) + 1
+        return self.rows[efficient]
+
+    def groupby(self, by: str, column: str, aggregation: str = "mean") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aggregates a column per distinct value of another column.
+
+        Returns:
+        Tuple[np.ndarray, np.ndarray]: Distinct values of `by` and the aggregate of `column` for each.
+        """
+        if aggregation not in self._aggregations:
+            raise ValueError(f"Unknown aggregation {aggregation}, expected one of {self._aggregations}")
+        keys, inverse = np.unique(self.column(by), return_inverse=True)
+        values = self.column(column).astype(np.float64)
+        counts = np.bincount(inverse, minlength=len(keys))
+        if aggregation == "count":
+            return keys, counts
+        if aggregation in ("sum", "mean"):
+            sums = np.bincount(inverse, weights=values, minlength=len(keys))
+            return keys, sums if aggregation == "sum" else sums / counts
+        result = np.full(len(keys), np.inf if aggregation == "min" else -np.inf)
+        (np.minimum if aggregation == "min" else np.maximum).at(result, inverse, values)
+        return keys, result
@@ -0,0 +1,253 @@
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class RuntimeHistory:
+    """
+    Observed backtest durations keyed by configuration hash.
+
+    Unknown configurations are predicted with the mean of all observed durations,
+    or with `default_seconds` if nothing was observed yet.
+    """
+
+    def __init__(self, default_seconds: float = 600.0):
+        self.default_seconds = default_seconds
+        self._durations: Dict[str, List[float]] = {}
+        self._total = 0.0
+        self._count = 0
+
+    def record(self, config, duration_seconds: float) -> None:
+        self._durations.setdefault(config.to_hash(), []).append(duration_seconds)
+        self._total += duration_seconds
+        self._count += 1
+
+    def predict(self, config) -> float:
+        durations = self._durations.get(config.to_hash())
+        if durations:
+            return sum(durations) / len(durations)
+        if self._count:
+            return self._total / self._count
+        return self.default_seconds
+
+
+@dataclass
+class NodeSlots:
+    name: str
+    slots: int
+
+
+@dataclass
+class ScheduledBacktest:
+    index: int
+    config: Any
+    node: str
+    expected_start: float
+    expected_duration: float
+
+    @property
+    def expected_end(self) -> float:
+        return self.expected_start + self.expected_duration
+
+
+@dataclass
+class SchedulePlan:
+    backtests: List[ScheduledBacktest] = field(default_factory=list)
+
+    @property
+    def makespan(self) -> float:
+        return max((backtest.expected_end for backtest in self.backtests), default=0.0)
+
+
+class CapacityScheduler:
+    """
+    Client-side scheduler packing backtests onto the servers of a cluster.
+
+    Every server offers `Cores // cores_per_backtest` slots, further limited by
+    `MemoryMB // memory_mb_per_backtest` when the node listing reports memory.
+    Backtests are ordered longest predicted runtime first and each one goes to the slot that
+    frees up earliest, which bounds the makespan to 4/3 of the optimum.
+
+    `node_api` is anything with a `get_nodes()` method returning the Nomad node listing keyed
+    by server name, so the scheduler can be simulated against a fake cluster.
+    """
+
+    def __init__(
+        self,
+        node_api,
+        servers: List[str],
+        history: RuntimeHistory,
+        cores_per_backtest: int = 1,
+        memory_mb_per_backtest: Optional[int] = None,
+    ):
+        self._node_api = node_api
+        self.servers = servers
+        self.history = history
+        self.cores_per_backtest = cores_per_backtest
+        self.memory_mb_per_backtest = memory_mb_per_backtest
+
+    def get_node_slots(self) -> List[NodeSlots]:
+        nodes = self._node_api.get_nodes()
+        node_slots = []
+        for server in self.servers:
+            node = nodes[server]
+            slots = int(node["Cores"]) // self.cores_per_backtest
+            if self.memory_mb_per_backtest and "MemoryMB" in node:
+                slots = min(slots, int(node["MemoryMB"]) // self.memory_mb_per_backtest)
+            node_slots.append(NodeSlots(name=server, slots=slots))
+        return node_slots
+
+    def plan(self, configs: List[Any]) -> SchedulePlan:
+        """
+        Assigns every configuration to a server slot, longest predicted runtime first.
+
+        Args:
+        configs (List[Any]): Configurations to schedule, `index` of a planned backtest refers to this list.
+
+        Returns:
+        SchedulePlan: Planned backtests in submission order along with the expected makespan.
+        """
+        slots = [(0.0, node.name, index) for node in self.get_node_slots() for index in range(node.slots)]
+        if not slots:
+            raise RuntimeError("No server has capacity for a single backtest")
+        heapq.heapify(slots)
+
+        durations = [self.history.predict(config) for config in configs]
+        plan = SchedulePlan()
+        for index in sorted(range(len(configs)), key=durations.__getitem__, reverse=True):
+            free_at, node, slot = heapq.heappop(slots)
+            plan.backtests.append(ScheduledBacktest(index, configs[index], node, free_at, durations[index]))
+            heapq.heappush(slots, (free_at + durations[index], node, slot))
+        plan.backtests.sort(key=lambda backtest: backtest.expected_start)
+        return plan
+
+    def run(
+        self,
+        plan: SchedulePlan,
+        submit: Callable[[ScheduledBacktest], Any],
+        is_finished: Callable[[Any], bool],
+        poll_interval: float = 5.0,
+        sleep: Callable[[float], None] = time.sleep,
+        busy_slots: Optional[Callable[[List[Any]], int]] = None,
+    ) -> List[Any]:
+        """
+        Submits planned backtests without exceeding the free slots of the servers.
+        Slots taken by jobs not submitted by this run are only known with `busy_slots`,
+        otherwise the servers are assumed to be idle.
+
+        Args:
+        plan (SchedulePlan): Plan produced by `plan`.
+        submit (Callable[[ScheduledBacktest], Any]): Submits a backtest, returns a handle for `is_finished`.
+        is_finished (Callable[[Any], bool]): Checks whether a submitted backtest finished.
+        poll_interval (float): Seconds between checks while all slots are busy.
+        sleep (Callable[[float], None]): Sleep function, replaceable in simulations.
+        busy_slots (Optional[Callable[[List[Any]], int]]): Given the running handles of this run, returns the
+        number of slots occupied by other jobs. Called before the first submission and on every poll.
+
+        Returns:
+        List[Any]: Handles of all submitted backtests in submission order.
+        """
+        capacity = sum(node.slots for node in self.get_node_slots())
+        handles = []
+        running = []
+        occupied = busy_slots(running) if busy_slots is not None else 0
+        for backtest in plan.backtests:
+            while len(running) + occupied >= capacity:
+                running = [handle for handle in running if not is_finished(handle)]
+                if busy_slots is not None:
+                    occupied = busy_slots(running)
+                if len(running) + occupied >= capacity:
+                    sleep(poll_interval)
+            handle = submit(backtest)
+            handles.append(handle)
+            running.append(handle)
+        return handles
+
+
+def flatten_features(config, prefix: str = "") -> Dict[str, float]:
+    """
+    Numeric leaves of a configuration keyed by their path, e.g. `model_configs.0.window`.
+    """
+    if hasattr(config, "config"):
+        config = config.config
+    features = {}
+    if isinstance(config, dict):
+        items = config.items()
+    elif isinstance(config, list):
+        items = enumerate(config)
+    else:
+        return features
+    for key, value in items:
+        path = f"{prefix}{key}"
+        if isinstance(value, (bool, int, float)):
+            features[path] = float(value)
+        else:
+            features.update(flatten_features(value, f"{path}."))
+    return features
+
+
+class RuntimePredictor:
+    """
+    Predicts backtest durations from the numeric features of their configurations.
+
+    Durations are predicted as the mean over the `neighbours` nearest past runs in standardized
+    feature space, so configurations that differ only in a few parameters inherit the runtime of
+    their closest relatives. Has the same `predict` interface as `RuntimeHistory`.
+    """
+
+    def __init__(self, neighbours: int = 5, default_seconds: float = 600.0):
+        self.neighbours = neighbours
+        self.default_seconds = default_seconds
+        self._feature_names: List[str] = []
+        self._features = None
+        self._durations = None
+
+    def fit(self, samples: Iterable[Tuple[Any, float]]) -> "RuntimePredictor":
+        samples = [(flatten_features(config), duration) for config, duration in samples if duration is not None]
+        self._feature_names = sorted({name for features, _ in samples for name in features})
+        if not samples:
+            self._features = None
+            return self
+        features = np.array([[features.get(name, 0.0) for name in self._feature_names] for features, _ in samples])
+        self._mean = features.mean(axis=0)
+        self._scale = features.std(axis=0)
+        self._scale[self._scale == 0] = 1.0
+        self._features = (features - self._mean) / self._scale
+        self._durations = np.array([duration for _, duration in samples])
+        return self
+
+    @classmethod
+    def from_evaluation_store(cls, store, model_hash: Optional[str] = None, **kwargs) -> "RuntimePredictor":
+        return cls(**kwargs).fit(store.durations(model_hash))
+
+    def predict(self, config) -> float:
+        if self._features is None:
+            return self.default_seconds
+        features = flatten_features(config)
+        point = (np.array([features.get(name, 0.0) for name in self._feature_names]) - self._mean) / self._scale
+        distances = np.linalg.norm(self._features - point, axis=1)
+        nearest = np.argsort(distances)[: self.neighbours]
+        return float(self._durations[nearest].mean())
+
+
+def lpt_makespan(durations: Iterable[float], slots: int) -> float:
+    """Makespan of running durations longest first on `slots` identical slots."""
+    finish_times = [0.0] * slots
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
+
+
+@dataclass
+class MakespanReport:
+    predicted: float
+    actual: float
+
+    def __str__(self) -> str:
+        if not self.predicted:
+            return f"makespan actual {self.actual:.1f}s"
+        error = self.actual / self.predicted - 1
+        return f"makespan predicted {self.predicted:.1f}s, actual {self.actual:.1f}s ({error:+.0%})"
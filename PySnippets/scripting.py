@@ -1,12 +1,24 @@
 import argparse
+import ast
+import hashlib
+import importlib
+import importlib.machinery
 import inspect
+import json
+import os
 import re
+import sys
 import asyncio
+import textwrap
+import weakref
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
     List,
+    Optional,
     Type,
     Union,
     get_args,
@@ -66,27 +78,66 @@ def is_list_type(param_type) -> bool:
     return get_origin(param_type) is list
 
 
-def add_function_parameters_to_parser(
-    func: Callable,
-    parser: argparse.ArgumentParser,
-    type_action_map: Dict[Type, Any] = None,
-    group_name: str = "",
-    blacklist: List[str] = None,
-):
-    if type_action_map is None:
-        type_action_map = {}
-    if blacklist is None:
-        blacklist = []
+@dataclass
+class ArgumentSpec:
+    """Everything needed to add one function parameter to a parser, in a JSON-serializable form."""
+
+    name: str
+    type_name: str
+    is_list: bool
+    required: bool
+    help: str
+    default: Any
+
+
+PARSER_SPEC_CACHE_DIRECTORY = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "scripting" / "parser_specs"
+
+_parser_specs: Dict[str, List[ArgumentSpec]] = {}
+# source file -> (mtime_ns, size, sha256), so a file is only hashed again after it changed
+_source_hashes: Dict[str, tuple] = {}
+_group_destinations = weakref.WeakKeyDictionary()
+
+
+def type_name(param_type) -> str:
+    """Name identifying a type in cached specs without importing it."""
+    if isinstance(param_type, type):
+        return f"{param_type.__module__}.{param_type.__qualname__}"
+    return repr(param_type)
+
+
+def source_hash(source_file: str) -> str:
+    stat = os.stat(source_file)
+    cached = _source_hashes.get(source_file)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(source_file, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    _source_hashes[source_file] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def parser_spec_cache_key(module: str, qualname: str, source_file: str) -> str:
+    return hashlib.sha256(f"{module}:{qualname}:{source_hash(source_file)}".encode()).hexdigest()
 
+
+def _unwrap_annotation(param_type):
+    if is_optional_type(param_type):
+        param_type = [arg for arg in get_args(param_type) if arg is not type(None)][0]
+    if is_list_type(param_type):
+        param_type = get_args(param_type)[0]
+    return param_type
+
+
+def compute_parameter_specs(func: Callable) -> List[ArgumentSpec]:
     signature = inspect.signature(func)
     type_hints = get_type_hints(func)
-    group = parser.add_argument_group(group_name)
 
     # Parse docstrings to get argument descriptions
     arg_docs = parse_docstring(func)
 
+    specs = []
     for param_name, param in signature.parameters.items():
-        if param_name in ("self", "cls") or param_name in blacklist:
+        if param_name in ("self", "cls"):
             continue
 
         param_type = type_hints.get(param_name, param.annotation)
@@ -95,53 +146,279 @@ def add_function_parameters_to_parser(
         if is_optional and is_optional_type(param_type):
             param_type = [arg for arg in get_args(param_type) if arg is not type(None)][0]
 
-        help_string = arg_docs.get(param_name, "")
-        default_value = param.default if param.default is not inspect.Parameter.empty else None
-
-        if is_list_type(param_type):
-            element_type = get_args(param_type)[0]
-            if element_type in type_action_map:
-                type_action = type_action_map[element_type]
-                if type_action != noop:
-                    group.add_argument(
-                        f"--{param_name}",
-                        type=type_action,
-                        nargs="+",
-                        required=not is_optional,
-                        help=help_string,
-                        default=default_value,
-                    )
-            else:
-                raise ValueError(f"Unknown type {element_type} for parameter {param_name}")
-        elif param_type in type_action_map:
-            type_action = type_action_map[param_type]
-            if type_action != noop:
-                group.add_argument(
-                    f"--{param_name}",
-                    type=type_action,
-                    required=not is_optional,
-                    help=help_string,
-                    default=default_value,
-                )
-        else:
-            if param_name == "loop":
+        is_list = is_list_type(param_type)
+        if is_list:
+            param_type = get_args(param_type)[0]
+
+        specs.append(
+            ArgumentSpec(
+                name=param_name,
+                type_name=type_name(param_type),
+                is_list=is_list,
+                required=not is_optional,
+                help=arg_docs.get(param_name, ""),
+                default=param.default if param.default is not inspect.Parameter.empty else None,
+            )
+        )
+    return specs
+
+
+def has_literal_defaults(func: Callable) -> bool:
+    """
+    Whether every default of the function is a literal in its signature. Other defaults, such as
+    a constant imported from another module, may change without the function's source file changing.
+    """
+    if all(param.default is inspect.Parameter.empty for param in inspect.signature(func).parameters.values()):
+        return True
+    try:
+        node = ast.parse(textwrap.dedent(inspect.getsource(func))).body[0]
+    except (OSError, TypeError, SyntaxError, IndexError):
+        return False
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+    for default in node.args.defaults + [default for default in node.args.kw_defaults if default is not None]:
+        try:
+            ast.literal_eval(default)
+        except (ValueError, TypeError, SyntaxError):
+            return False
+    return True
+
+
+def parameter_spec_dependencies(func: Callable) -> List[str]:
+    """
+    Source files the specs of the function depend on: its own, and those of modules defining its annotation types.
+    """
+    files = {func.__code__.co_filename}
+    for param_type in get_type_hints(func).values():
+        module = sys.modules.get(getattr(_unwrap_annotation(param_type), "__module__", None))
+        module_file = getattr(module, "__file__", None)
+        if module_file is not None:
+            files.add(module_file)
+    return sorted(files)
+
+
+def load_parameter_specs(cache_key: str) -> Optional[List[ArgumentSpec]]:
+    """Returns specs cached in memory or on disk, or None if missing or any file they depend on changed."""
+    if cache_key in _parser_specs:
+        return _parser_specs[cache_key]
+    try:
+        with open(PARSER_SPEC_CACHE_DIRECTORY / f"{cache_key}.json", "r") as file:
+            entry = json.load(file)
+        for dependency, digest in entry["dependencies"].items():
+            if source_hash(dependency) != digest:
+                return None
+        specs = [ArgumentSpec(**spec) for spec in entry["specs"]]
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+    _parser_specs[cache_key] = specs
+    return specs
+
+
+def store_parameter_specs(cache_key: str, specs: List[ArgumentSpec], func: Callable) -> None:
+    """Caches specs of `func` in memory, and on disk with the hashes of the files they depend on."""
+    _parser_specs[cache_key] = specs
+    if not has_literal_defaults(func):
+        return
+    serialized = [asdict(spec) for spec in specs]
+    try:
+        dependencies = {dependency: source_hash(dependency) for dependency in parameter_spec_dependencies(func)}
+        content = json.dumps({"specs": serialized, "dependencies": dependencies})
+    except (OSError, TypeError):
+        # defaults that are not JSON-serializable are only cached in memory
+        return
+    if json.loads(content)["specs"] != serialized:
+        # defaults JSON would change, e.g. tuples coming back as lists, are only cached in memory
+        return
+    PARSER_SPEC_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    path = PARSER_SPEC_CACHE_DIRECTORY / f"{cache_key}.json"
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(content)
+    os.replace(temp_path, path)
+
+
+def get_parameter_specs(func: Callable) -> List[ArgumentSpec]:
+    """
+    Returns argument specs of the function, computing them only when a file they depend on changed.
+    Specs are cached by module, qualified name and the hash of the source file, and on disk checked
+    against the files defining annotation types. Specs with non-literal defaults are not cached on disk.
+    """
+    func = inspect.unwrap(func)
+    try:
+        cache_key = parser_spec_cache_key(func.__module__, func.__qualname__, func.__code__.co_filename)
+    except (OSError, AttributeError):
+        # no source file to validate the cache against, or no code object (classes, callable objects)
+        return compute_parameter_specs(func)
+    specs = load_parameter_specs(cache_key)
+    if specs is None:
+        specs = compute_parameter_specs(func)
+        store_parameter_specs(cache_key, specs, func)
+    return specs
+
+
+def add_parameter_specs_to_parser(
+    specs: List[ArgumentSpec],
+    parser: argparse.ArgumentParser,
+    type_action_map: Dict[Type, Any] = None,
+    group_name: str = "",
+    blacklist: List[str] = None,
+):
+    if type_action_map is None:
+        type_action_map = {}
+    if blacklist is None:
+        blacklist = []
+
+    type_actions = {type_name(param_type): action for param_type, action in type_action_map.items()}
+    group = parser.add_argument_group(group_name)
+
+    for spec in specs:
+        if spec.name in blacklist:
+            continue
+
+        if spec.type_name not in type_actions:
+            if spec.name == "loop" and not spec.is_list:
                 continue
 
-            raise ValueError(f"Unknown type {param_type} for parameter {param_name}")
+            raise ValueError(f"Unknown type {spec.type_name} for parameter {spec.name}")
+
+        type_action = type_actions[spec.type_name]
+        if type_action == noop:
+            continue
+
+        kwargs = {"nargs": "+"} if spec.is_list else {}
+        group.add_argument(
+            f"--{spec.name}",
+            type=type_action,
+            required=spec.required,
+            help=spec.help,
+            default=spec.default,
+            **kwargs,
+        )
+
+
+def add_function_parameters_to_parser(
+    func: Callable,
+    parser: argparse.ArgumentParser,
+    type_action_map: Dict[Type, Any] = None,
+    group_name: str = "",
+    blacklist: List[str] = None,
+):
+    add_parameter_specs_to_parser(get_parameter_specs(func), parser, type_action_map, group_name, blacklist)
+
+
+def get_group_destinations(parser: argparse.ArgumentParser) -> Dict[str, tuple]:
+    """Returns destinations of every argument group keyed by group title, reindexed only when actions were added."""
+    action_count, destinations = _group_destinations.get(parser, (None, None))
+    if action_count != len(parser._actions):
+        destinations = {}
+        for action_group in parser._action_groups:
+            destinations.setdefault(action_group.title, tuple(action.dest for action in action_group._group_actions))
+        _group_destinations[parser] = (len(parser._actions), destinations)
+    return destinations
 
 
 def extract_group_arguments(args, parser, groupname):
-    group = None
-    for action_group in parser._action_groups:
-        if action_group.title == groupname:
-            group = action_group
-            break
+    destinations = get_group_destinations(parser).get(groupname)
 
-    if group is None:
+    if destinations is None:
         raise ValueError(f"No argument group named '{groupname}' found")
 
-    group_args = {
-        arg: getattr(args, arg) for arg in vars(args) if arg in {action.dest for action in group._group_actions}
-    }
+    group_args = {arg: getattr(args, arg) for arg in destinations if hasattr(args, arg)}
     return group_args
 
+
+def resolve_target(target: str) -> Callable:
+    """Imports `package.module:function` (or `module:Class.method`) and returns the callable."""
+    module_name, qualname = target.split(":")
+    obj = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def find_module_origin(module_name: str) -> Optional[str]:
+    """
+    Returns the source file of a module without importing it or its parent packages.
+    The module is looked up on sys.path package by package, like the import system would, or None if not found.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return getattr(getattr(module, "__spec__", None), "origin", None)
+    search_path = None
+    module_spec = None
+    parts = module_name.split(".")
+    for depth in range(1, len(parts) + 1):
+        module_spec = importlib.machinery.PathFinder.find_spec(".".join(parts[:depth]), search_path)
+        if module_spec is None:
+            return None
+        search_path = module_spec.submodule_search_locations
+        if depth < len(parts) and search_path is None:
+            return None
+    return module_spec.origin if module_spec.has_location else None
+
+
+class LazySubcommands:
+    """
+    Subcommands declared by import path, e.g. `add("submit", "orion_py.nomad.cli:submit")`.
+
+    Only the module of the chosen subcommand is imported, and only when the command runs or its
+    parameter specs are not cached yet. Listing commands and `<command> --help` with warm caches
+    import nothing, so startup does not grow with the number of commands.
+    """
+
+    def __init__(
+        self,
+        parser: argparse.ArgumentParser,
+        type_action_map: Dict[Type, Any] = None,
+        blacklist: List[str] = None,
+    ):
+        self.parser = parser
+        self.type_action_map = type_action_map
+        self.blacklist = blacklist
+        self._commands: Dict[str, tuple] = {}
+        self._chosen_parser = None
+
+    def add(self, name: str, target: str, help: str = "") -> None:
+        self._commands[name] = (target, help)
+
+    def get_parameter_specs(self, target: str) -> List[ArgumentSpec]:
+        module_name, qualname = target.split(":")
+        origin = find_module_origin(module_name)
+        target_key = parser_spec_cache_key(module_name, qualname, origin) if origin is not None else None
+        if target_key is not None:
+            specs = load_parameter_specs(target_key)
+            if specs is not None:
+                return specs
+        func = resolve_target(target)
+        specs = get_parameter_specs(func)
+        if target_key is not None:
+            # re-exported functions are defined elsewhere, also cache them under the target, checked
+            # against the defining file, so the next lookup finds them without importing anything
+            func = inspect.unwrap(func)
+            if hasattr(func, "__code__"):
+                store_parameter_specs(target_key, specs, func)
+        return specs
+
+    def parse_args(self, args: List[str] = None) -> argparse.Namespace:
+        args = sys.argv[1:] if args is None else list(args)
+        chosen = next((arg for arg in args if arg in self._commands), None)
+
+        subparsers = self.parser.add_subparsers(dest="_subcommand", required=True)
+        for name, (target, help) in self._commands.items():
+            subparser = subparsers.add_parser(name, help=help)
+            if name == chosen:
+                add_parameter_specs_to_parser(
+                    self.get_parameter_specs(target), subparser, self.type_action_map, name, self.blacklist
+                )
+                self._chosen_parser = subparser
+
+        return self.parser.parse_args(args)
+
+    def run(self, args: List[str] = None) -> Any:
+        """Parses arguments, imports the chosen command and calls it, running coroutine functions to completion."""
+        namespace = self.parse_args(args)
+        name = namespace._subcommand
+        func = resolve_target(self._commands[name][0])
+        result = func(**extract_group_arguments(namespace, self._chosen_parser, name))
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        return result
@@ -0,0 +1,152 @@
+import itertools
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from hyperparameter_grid import HyperparameterGrid
+
+
+class TPEGenerator:
+    """
+    Tree-structured Parzen estimator proposing candidates from the value tables of a HyperparameterGrid.
+
+    Observed rows are split into the best `gamma` fraction and the rest. For every hyperparameter a
+    smoothed density over its value table is fit to each part, l(x) for the good rows and g(x) for the
+    rest. Candidates are sampled from l and the ones maximizing l(x) / g(x) are proposed. Rows that
+    were already observed or are still being evaluated are never proposed again, so a batch keeps all
+    cores busy with distinct backtests.
+
+    Attributes:
+    grid (HyperparameterGrid): Hyperparameters and their candidate values.
+    maximize (bool): Whether higher scores are better.
+    """
+    # rounds of uniform draws topping up a batch that sampling could not fill with unseen rows
+    _fill_rounds = 8
+    # grids up to this size are enumerated when even uniform draws miss their remaining rows
+    _enumeration_limit = 1 << 20
+
+    def __init__(
+        self,
+        grid: HyperparameterGrid,
+        gamma: float = 0.25,
+        startup_count: int = 10,
+        candidate_count: int = 256,
+        prior_weight: float = 1.0,
+        maximize: bool = True,
+        seed: Optional[int] = None,
+    ):
+        self.grid = grid
+        self.gamma = gamma
+        self.startup_count = startup_count
+        self.candidate_count = candidate_count
+        self.prior_weight = prior_weight
+        self.maximize = maximize
+        self._rng = np.random.default_rng(seed)
+        self._rows: List[Tuple[int, ...]] = []
+        self._scores: List[float] = []
+        self._pending = set()
+        # rows pending when the state was checkpointed, proposed again first after a restore
+        self._resumed: List[Tuple[int, ...]] = []
+
+    @property
+    def evaluation_count(self) -> int:
+        """Number of rows observed or proposed and still being evaluated."""
+        return len(self._rows) + len(self._pending)
+
+    def observe(self, row, score: float) -> None:
+        row = tuple(int(index) for index in row)
+        self._pending.discard(row)
+        self._rows.append(row)
+        self._scores.append(score if self.maximize else -score)
+
+    def get_state(self) -> dict:
+        """Observations, rows being evaluated and the random generator state as plain JSON types, for checkpointing."""
+        return {
+            "rows": [list(row) for row in self._rows],
+            "scores": list(self._scores),
+            "pending": sorted(list(row) for row in self._pending),
+            "rng": self._rng.bit_generator.state,
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restores a state from `get_state`. Rows that were being evaluated are proposed again first,
+        and proposals after them continue the random sequence of the checkpointed generator.
+        """
+        self._rows = [tuple(row) for row in state["rows"]]
+        self._scores = list(state["scores"])
+        self._resumed = [tuple(row) for row in state["pending"]]
+        self._pending = set(self._resumed)
+        self._rng.bit_generator.state = state["rng"]
+
+    def _density(self, observed: np.ndarray, size: int) -> np.ndarray:
+        """Probabilities over a value table: Gaussian kernels around observed indices mixed with a uniform prior."""
+        positions = np.arange(size)
+        bandwidth = max(1.0, size / (len(observed) + 1))
+        kernels = np.exp(-0.5 * ((positions[None, :] - observed[:, None]) / bandwidth) ** 2)
+        kernels /= kernels.sum(axis=1, keepdims=True)
+        density = kernels.sum(axis=0) + self.prior_weight / size
+        return density / density.sum()
+
+    def propose(self, batch_size: int) -> np.ndarray:
+        """
+        Returns up to `batch_size` new index rows, fewer only if the grid is exhausted.
+        """
+        batch = self._resumed[:batch_size]
+        del self._resumed[:batch_size]
+        if len(batch) == batch_size:
+            return np.asarray(batch, dtype=np.int64).reshape(-1, len(self.grid.shape))
+
+        if len(self._rows) < max(self.startup_count, 1):
+            candidates = self.grid.latin_hypercube(max(batch_size, self.candidate_count), seed=self._rng.integers(1 << 32))
+            scores = self._rng.random(len(candidates))
+        else:
+            rows = np.asarray(self._rows)
+            order = np.argsort(self._scores)[::-1]
+            good_count = max(1, int(np.ceil(self.gamma * len(rows))))
+            good, bad = rows[order[:good_count]], rows[order[good_count:]]
+
+            candidates = np.empty((self.candidate_count, len(self.grid.shape)), dtype=np.int64)
+            scores = np.zeros(self.candidate_count)
+            for dimension, size in enumerate(self.grid.shape):
+                good_density = self._density(good[:, dimension], size)
+                bad_density = self._density(bad[:, dimension], size)
+                candidates[:, dimension] = self._rng.choice(size, size=self.candidate_count, p=good_density)
+                scores += np.log(good_density[candidates[:, dimension]]) - np.log(bad_density[candidates[:, dimension]])
+
+        seen = self._pending.union(self._rows)
+        for index in np.argsort(scores)[::-1]:
+            row = tuple(int(value) for value in candidates[index])
+            if row not in seen:
+                seen.add(row)
+                batch.append(row)
+                if len(batch) == batch_size:
+                    break
+
+        # sampling may miss the few remaining rows of an almost exhausted grid
+        for _ in range(self._fill_rounds):
+            if len(batch) == batch_size or len(seen) >= len(self.grid):
+                break
+            draws = self._rng.integers(0, self.grid.shape, size=(batch_size, len(self.grid.shape)))
+            for row in map(tuple, draws.tolist()):
+                if row not in seen:
+                    seen.add(row)
+                    batch.append(row)
+                    if len(batch) == batch_size:
+                        break
+        if len(batch) < batch_size and len(seen) < len(self.grid) <= self._enumeration_limit:
+            for row in itertools.product(*map(range, self.grid.shape)):
+                if row not in seen:
+                    seen.add(row)
+                    batch.append(row)
+                    if len(batch) == batch_size:
+                        break
+
+        self._pending.update(batch)
+        return np.asarray(batch, dtype=np.int64).reshape(-1, len(self.grid.shape))
+
+    def propose_configurations(self, batch_size: int) -> List[tuple]:
+        """
+        Returns (row, configuration) pairs, pass the row back to `observe` with the score of the configuration.
+        """
+        return [(row, self.grid.materialize(row)) for row in self.propose(batch_size)]
@@ -0,0 +1,146 @@
+import asyncio
+import functools
+
+import pytest
+
+from config import AppConfig, Config, DatabaseConfig, LogConfig
+
+
+class PropertyConfig(Config):
+    def __init__(self, d):
+        self.target = d.get("target")
+
+    @property
+    def target(self):
+        return self._target
+
+    @target.setter
+    def target(self, value):
+        self._target = value
+
+
+def _logged(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class DecoratedConfig(Config):
+    def __init__(self, d):
+        object.__setattr__(self, "_x", d.get("x"))
+        self.b = d.get("b")
+
+    @property
+    def b(self):
+        return self._b
+
+    @b.setter
+    @_logged
+    def b(self, value):
+        self._b = value
+
+
+class SetattrConfig(Config):
+    def __init__(self, d):
+        for key, value in d.items():
+            setattr(self, key, value)
+
+
+class ParentConfig(Config):
+    s: SetattrConfig
+    log: LogConfig
+
+
+def test_property_setter_is_not_shadowed():
+    config = PropertyConfig({"target": "path"})
+    assert config.target == "path"
+
+
+def test_decorated_setter_and_object_setattr():
+    config = DecoratedConfig({"x": 1, "b": 2})
+    assert (config._x, config.b) == (1, 2)
+
+
+def test_dynamic_attributes():
+    config = SetattrConfig({"host": "localhost", "port": 1234})
+    assert (config.host, config.port) == ("localhost", 1234)
+    app = AppConfig({})
+    app.foo = 1
+    assert app.foo == 1
+
+
+def test_sub_config_attributes_are_resolved():
+    parent = ParentConfig({"s": {"host": "x"}, "log": {"target": "t"}})
+    # dynamic attribute of a sub-config, found by the fallback scan
+    assert parent.host == "x"
+    # attribute assigned in a sub-config method, resolved by its precomputed path
+    assert "_target" in ParentConfig._paths
+    assert parent._target == "t"
+    parent.set_target("u")
+    assert parent.log._target == "u"
+    with pytest.raises(AttributeError):
+        parent.missing
+
+
+async def _echo(reader, writer):
+    while data := await reader.read(1024):
+        writer.write(data)
+        await writer.drain()
+    writer.close()
+
+
+def test_database_config_pools_connections_to_local_server():
+    async def scenario():
+        server = await asyncio.start_server(_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        database = DatabaseConfig({"host": "127.0.0.1", "port": port, "min_pool_size": 2, "max_pool_size": 2})
+        pool = await database.connect()
+        assert await database.connect() is pool
+
+        async def roundtrip(message):
+            async with pool.connection() as (reader, writer):
+                writer.write(message)
+                await writer.drain()
+                return await reader.readexactly(len(message))
+
+        assert await asyncio.gather(*(roundtrip(f"ping {i}".encode()) for i in range(5))) == [
+            f"ping {i}".encode() for i in range(5)
+        ]
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_database_config_retries_connect_after_failure():
+    async def scenario():
+        server = await asyncio.start_server(_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+
+        database = DatabaseConfig({"host": "127.0.0.1", "port": port, "connect_retries": 1})
+        with pytest.raises(OSError):
+            await database.connect()
+        assert database._pool is None
+
+        server = await asyncio.start_server(_echo, "127.0.0.1", port)
+        pool = await database.connect()
+        async with pool.connection() as (reader, writer):
+            writer.write(b"ping")
+            assert await reader.readexactly(4) == b"ping"
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_database_config_rejects_connect_without_attempts():
+    database = DatabaseConfig({"connect_retries": 0})
+    with pytest.raises(ValueError):
+        asyncio.run(database.connect())
+    assert database._pool is None
@@ -0,0 +1,197 @@
+"""
+Lightweight spans, counters and sampling profiles for the sweep hot paths.
+
+Disabled by default: `span` then returns a shared no-op context manager and `traced` functions
+cost one flag check per call. After `enable()`, spans are collected in memory and can be
+exported as a Chrome trace (chrome://tracing, Perfetto) or as OpenMetrics text.
+"""
+import collections
+import functools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+_enabled = False
+_events = []
+_counters: Dict[str, float] = collections.defaultdict(float)
+_span_totals: Dict[str, list] = collections.defaultdict(lambda: [0, 0.0])
+_profile_directory: Optional[Path] = None
+
+
+def enable(profile_directory: Optional[Path] = None) -> None:
+    """
+    Starts collecting spans and counters. With `profile_directory`, backtest processes
+    wrapped by `ProfiledTarget` write sampled stacks there.
+    """
+    global _enabled, _profile_directory
+    _enabled = True
+    _profile_directory = profile_directory
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: Optional[dict]):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter_ns() - self.start
+        event = {
+            "name": self.name,
+            "ph": "X",
+            "ts": self.start // 1000,
+            "dur": duration // 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if self.args:
+            event["args"] = self.args
+        _events.append(event)
+        totals = _span_totals[self.name]
+        totals[0] += 1
+        totals[1] += duration / 1e9
+        return False
+
+
+def span(name: str, **args):
+    """Context manager timing a block, a no-op while tracing is disabled."""
+    if not _enabled:
+        return _NOOP_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator timing every call of the function as a span named `name` (qualified name by default)."""
+
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def increment(name: str, value: float = 1) -> None:
+    if _enabled:
+        _counters[name] += value
+
+
+def export_chrome_trace(path: Path) -> None:
+    with open(path, "w") as file:
+        json.dump({"traceEvents": list(_events), "displayTimeUnit": "ms"}, file)
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def export_openmetrics(path: Path) -> None:
+    lines = []
+    for name, value in sorted(_counters.items()):
+        metric = _metric_name(name)
+        lines += [f"# TYPE {metric} counter", f"{metric}_total {value}"]
+    for name, (count, seconds) in sorted(_span_totals.items()):
+        metric = f"{_metric_name(name)}_seconds"
+        lines += [f"# TYPE {metric} summary", f"{metric}_count {count}", f"{metric}_sum {seconds}"]
+    lines.append("# EOF")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def reset() -> None:
+    _events.clear()
+    _counters.clear()
+    _span_totals.clear()
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread every `interval` seconds from a background thread
+    and writes the counts in collapsed-stack format, readable by flamegraph tools and speedscope.
+    """
+
+    def __init__(self, output_path: Path, interval: float = 0.01, thread_id: Optional[int] = None):
+        self.output_path = output_path
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stacks = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(f"{frame.f_code.co_filename}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        with open(self.output_path, "w") as file:
+            for stack, count in self._stacks.most_common():
+                file.write(f"{stack} {count}\n")
+        return False
+
+
+class ProfiledTarget:
+    """
+    Process target running `target` under a SamplingProfiler when profiling was enabled.
+    A class rather than a closure, so it can be pickled to spawned processes.
+    """
+
+    def __init__(self, target: Callable, name: str):
+        self.target = target
+        self.name = name
+        self.profile_directory = _profile_directory
+
+    def __call__(self, *args, **kwargs):
+        if self.profile_directory is None:
+            return self.target(*args, **kwargs)
+        self.profile_directory.mkdir(parents=True, exist_ok=True)
+        with SamplingProfiler(self.profile_directory / f"{self.name}.{os.getpid()}.collapsed"):
+            return self.target(*args, **kwargs)